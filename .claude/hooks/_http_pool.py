@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for the simple diagnostics and endpoint test hooks:
+terminal colors and status lines, JSON helpers and a keep-alive
+HTTP connection pool.
+"""
+
+import http.client
+import json
+import queue
+import zlib
+
+# Optional faster JSON; the stdlib json module is used otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Colors
+RED = '\033[0;31m'
+GREEN = '\033[0;32m'
+YELLOW = '\033[1;33m'
+BLUE = '\033[0;34m'
+CYAN = '\033[0;36m'
+MAGENTA = '\033[0;35m'
+NC = '\033[0m'
+
+# Status prefixes, built once instead of formatted on every line
+OK = f"{GREEN}✅ "
+WARN = f"{YELLOW}⚠️  "
+FAIL = f"{RED}❌ "
+
+def log(out, prefix, msg):
+    """Append one status line to a check's output buffer"""
+    out.write(f"{prefix}{msg}{NC}\n")
+
+def json_dumps(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+# Both accept bytes or str
+json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+class ConnectionPool:
+    """Keep-alive http.client connections to one host, safe to share across threads"""
+    
+    # Sent with every request; compressed bodies are decoded in _decode_body
+    DEFAULT_HEADERS = {'Accept-Encoding': 'gzip, deflate', 'Connection': 'keep-alive'}
+    
+    def __init__(self, host, port, maxsize=4):
+        self.host = host
+        self.port = port
+        self._idle = queue.LifoQueue(maxsize)
+        
+    def _checkout(self, timeout):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            return http.client.HTTPConnection(self.host, self.port, timeout=timeout), False
+        conn.timeout = timeout
+        if conn.sock:
+            conn.sock.settimeout(timeout)
+        return conn, True
+        
+    def _checkin(self, conn, response):
+        if response.will_close:
+            conn.close()
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+            
+    @staticmethod
+    def _decode_body(response_headers, data, limit):
+        if limit == 0:
+            return b''
+        encoding = response_headers.get('Content-Encoding', '').lower()
+        if data and encoding in ('gzip', 'deflate'):
+            # Only inflate as much as the caller is going to look at;
+            # wbits=47 accepts gzip and zlib framing, raw deflate is the fallback
+            try:
+                return zlib.decompressobj(47).decompress(data, limit or 0)
+            except zlib.error:
+                return zlib.decompressobj(-zlib.MAX_WBITS).decompress(data, limit or 0)
+        return data if limit is None else data[:limit]
+        
+    def request(self, method, path, body=None, headers=None, timeout=10, limit=None):
+        """Send a request and return (status, headers, body bytes), the body cut to limit bytes"""
+        request_headers = {**self.DEFAULT_HEADERS, **(headers or {})}
+        while True:
+            conn, reused = self._checkout(timeout)
+            try:
+                conn.request(method, path, body=body, headers=request_headers)
+                response = conn.getresponse()
+                data = response.read()
+            except (ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused:
+                    continue  # server dropped an idle connection; retry on another
+                raise
+            except Exception:
+                conn.close()
+                raise
+            self._checkin(conn, response)
+            return response.status, response.headers, self._decode_body(response.headers, data, limit)
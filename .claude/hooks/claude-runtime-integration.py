@@ -11,12 +11,22 @@ import json
 import os
 import sys
 import time
-import yaml
+from collections import Counter, defaultdict, deque
+from dataclasses import asdict
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from statistics import fmean
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
+import functools
 import hashlib
-import pickle
+import heapq
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Colors
 RED = '\033[0;31m'
@@ -27,27 +37,71 @@ CYAN = '\033[0;36m'
 MAGENTA = '\033[0;35m'
 NC = '\033[0m'
 
+# Skip color codes entirely when output is not a terminal (CI logs, pipes)
+if not sys.stdout.isatty():
+    RED = GREEN = YELLOW = BLUE = CYAN = MAGENTA = NC = ''
+
+def cprint(color: str, msg: str):
+    """Write a message wrapped in a color code with a single write call"""
+    sys.stdout.write(color + msg + NC + '\n')
+
+# Number of performance datapoints kept in the session
+PERFORMANCE_HISTORY_SIZE = 50
+
+# Baseline metrics, stored as one list in this order
+BASELINE_METRIC_KEYS = (
+    'page_load_time', 'dom_content_loaded', 'first_paint', 'first_contentful_paint',
+    'largest_contentful_paint', 'cumulative_layout_shift', 'first_input_delay',
+    'time_to_interactive', 'memory_usage'
+)
+
+# Cap on tracked issues; compaction evicts the rarest down to the low-water mark
+MAX_HISTORICAL_ISSUES = 1000
+HISTORICAL_ISSUES_LOW_WATER = 900
+
+# Recommendations shown per run
+MAX_RECOMMENDATIONS = 10
+
+# Metrics compared between recent and older runs
+TREND_METRICS = ('page_load_time', 'first_contentful_paint', 'memory_usage')
+
+def _best_metric(current: Optional[float], new: Any) -> Optional[float]:
+    """Lower is better for every baseline metric; ignore missing values"""
+    if not isinstance(new, (int, float)):
+        return current
+    return new if current is None or new < current else current
+
+@functools.lru_cache(maxsize=4096)
+def _issue_hash(issue: str) -> str:
+    """Stable key for an issue string; the same errors recur across runs"""
+    return hashlib.blake2b(issue.encode(), digest_size=16).hexdigest()
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_config(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML config once per file version; mtime invalidates the cache"""
+    import yaml
+    
+    with open(path, 'r') as f:
+        return yaml.safe_load(f)
+
 class SessionPersistence:
     """Manages session data persistence across runs"""
     
     def __init__(self, session_dir: str = ".claude/sessions"):
         self.session_dir = Path(session_dir)
-        self.session_dir.mkdir(parents=True, exist_ok=True)
-        self.session_file = self.session_dir / "diagnostics_session.pkl"
+        # One JSON file per top-level key so saves only rewrite what changed
+        self.session_path = self.session_dir / "diagnostics_session"
+        self.session_path.mkdir(parents=True, exist_ok=True)
+        self.legacy_session_file = self.session_dir / "diagnostics_session.pkl"
+        self._dirty: Set[str] = set()
         self.session_data = self.load_session()
         
     def load_session(self) -> Dict[str, Any]:
         """Load existing session data"""
-        if self.session_file.exists():
-            try:
-                with open(self.session_file, 'rb') as f:
-                    return pickle.load(f)
-            except:
-                pass
-        return {
+        session_data = {
             'baseline_metrics': {},
-            'historical_issues': [],
-            'performance_history': [],
+            'historical_issues': {},  # issue hash -> issue
+            'performance_history': {'timestamp': []},  # column per metric
             'test_patterns': [],
             'user_preferences': {},
             'security_baseline': {},
@@ -56,51 +110,139 @@ class SessionPersistence:
             'total_runtime': 0.0
         }
         
+        key_files = list(self.session_path.glob('*.json'))
+        if key_files:
+            for key_file in key_files:
+                try:
+                    data = key_file.read_bytes()
+                    session_data[key_file.stem] = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+                except:
+                    pass
+        elif self.legacy_session_file.exists():
+            # One-time migration from the old pickle format
+            import pickle
+            
+            try:
+                with open(self.legacy_session_file, 'rb') as f:
+                    session_data.update(pickle.load(f))
+                self._dirty.update(session_data)
+            except:
+                pass
+                
+        # Older sessions stored issues as a list keyed by md5
+        issues = session_data['historical_issues']
+        if isinstance(issues, list):
+            issues = {issue['hash']: issue for issue in issues}
+        if issues:
+            sample = next(iter(issues.values()))
+            if sample['hash'] != _issue_hash(sample['issue']):
+                for issue in issues.values():
+                    issue['hash'] = _issue_hash(issue['issue'])
+                issues = {issue['hash']: issue for issue in issues.values()}
+        if issues is not session_data['historical_issues']:
+            session_data['historical_issues'] = issues
+            self._dirty.add('historical_issues')
+            
+        # Older sessions stored the performance baseline as a dict
+        baseline = session_data['baseline_metrics'].get('performance')
+        if isinstance(baseline, dict):
+            session_data['baseline_metrics']['performance'] = [
+                _best_metric(None, baseline.get(key)) for key in BASELINE_METRIC_KEYS
+            ]
+            self._dirty.add('baseline_metrics')
+            
+        # Older sessions stored performance history as a list of datapoints
+        history = session_data['performance_history']
+        if isinstance(history, list):
+            columns = {'timestamp': [p['timestamp'] for p in history]}
+            for i, datapoint in enumerate(history):
+                for key, value in datapoint['metrics'].items():
+                    columns.setdefault(key, [None] * len(history))[i] = value
+            session_data['performance_history'] = columns
+            self._dirty.add('performance_history')
+            
+        # Columns are ring buffers in memory and plain lists on disk
+        session_data['performance_history'] = {
+            key: deque(column, maxlen=PERFORMANCE_HISTORY_SIZE)
+            for key, column in session_data['performance_history'].items()
+        }
+        return session_data
+        
+    def mark_dirty(self, *keys: str):
+        """Flag top-level session keys as modified since the last save"""
+        self._dirty.update(keys)
+        
     def save_session(self):
-        """Save current session data"""
+        """Save modified session data"""
+        if not self._dirty:
+            return
+            
         try:
-            with open(self.session_file, 'wb') as f:
-                pickle.dump(self.session_data, f)
+            for key in sorted(self._dirty):
+                value = self.session_data[key]
+                if ORJSON_AVAILABLE:
+                    data = orjson.dumps(value, option=orjson.OPT_INDENT_2, default=list)
+                else:
+                    data = json.dumps(value, indent=2, default=list).encode()
+                    
+                # Write to a temp file and rename so a crash never leaves a torn file
+                key_file = self.session_path / f"{key}.json"
+                tmp_file = key_file.with_suffix('.tmp')
+                tmp_file.write_bytes(data)
+                tmp_file.replace(key_file)
+                self._dirty.discard(key)
         except Exception as e:
-            print(f"{YELLOW}Warning: Could not save session data: {e}{NC}")
+            cprint(YELLOW, f"Warning: Could not save session data: {e}")
             
     def update_baseline_metrics(self, metrics: Dict[str, Any]):
         """Update baseline performance metrics"""
-        if 'performance' not in self.session_data['baseline_metrics']:
-            self.session_data['baseline_metrics']['performance'] = metrics
-        else:
-            # Update with improved metrics only
-            baseline = self.session_data['baseline_metrics']['performance']
-            for key, value in metrics.items():
-                if isinstance(value, (int, float)):
-                    if key not in baseline or value < baseline[key]:
-                        baseline[key] = value
+        new_values = [metrics.get(key) for key in BASELINE_METRIC_KEYS]
+        baseline = self.session_data['baseline_metrics'].get('performance')
+        if baseline is None:
+            baseline = [None] * len(BASELINE_METRIC_KEYS)
+            
+        # Update with improved metrics only
+        self.session_data['baseline_metrics']['performance'] = list(map(_best_metric, baseline, new_values))
+        self._dirty.add('baseline_metrics')
+        
+    def get_baseline_metrics(self) -> Dict[str, Optional[float]]:
+        """Baseline performance metrics keyed by metric name"""
+        baseline = self.session_data['baseline_metrics'].get('performance')
+        if baseline is None:
+            return {}
+        return dict(zip(BASELINE_METRIC_KEYS, baseline))
                         
     def add_performance_datapoint(self, metrics: Dict[str, Any]):
         """Add performance data point to history"""
-        datapoint = {
-            'timestamp': datetime.now().isoformat(),
-            'metrics': metrics
-        }
-        self.session_data['performance_history'].append(datapoint)
-        
-        # Keep only last 50 datapoints
-        if len(self.session_data['performance_history']) > 50:
-            self.session_data['performance_history'] = self.session_data['performance_history'][-50:]
+        history = self.session_data['performance_history']
+        length = len(history['timestamp'])
+        history['timestamp'].append(datetime.now().isoformat())
+        
+        # Metrics are stored column-wise; pad columns for newly seen metrics.
+        # Each column is a bounded deque, so old datapoints drop off in O(1)
+        for key in metrics:
+            if key not in history:
+                history[key] = deque([None] * length, maxlen=PERFORMANCE_HISTORY_SIZE)
+        for key, column in history.items():
+            if key != 'timestamp':
+                column.append(metrics.get(key))
+        self._dirty.add('performance_history')
             
     def get_performance_trends(self) -> Dict[str, str]:
         """Analyze performance trends"""
-        if len(self.session_data['performance_history']) < 2:
+        history = self.session_data['performance_history']
+        if len(history['timestamp']) < 2:
             return {}
             
-        recent = self.session_data['performance_history'][-5:]
-        older = self.session_data['performance_history'][-10:-5] if len(self.session_data['performance_history']) >= 10 else []
-        
         trends = {}
-        if older:
-            for metric in ['page_load_time', 'first_contentful_paint', 'memory_usage']:
-                recent_avg = sum(p['metrics'].get(metric, 0) for p in recent) / len(recent)
-                older_avg = sum(p['metrics'].get(metric, 0) for p in older) / len(older)
+        length = len(history['timestamp'])
+        if length >= 10:
+            for metric in TREND_METRICS:
+                column = history.get(metric)
+                if column is None:
+                    continue
+                recent_avg = fmean(value or 0 for value in islice(column, length - 5, length))
+                older_avg = fmean(value or 0 for value in islice(column, length - 10, length - 5))
                 
                 if recent_avg < older_avg * 0.9:
                     trends[metric] = 'improving'
@@ -113,28 +255,51 @@ class SessionPersistence:
         
     def track_issue(self, issue: str, category: str):
         """Track recurring issues"""
-        issue_hash = hashlib.md5(issue.encode()).hexdigest()
-        issue_data = {
-            'hash': issue_hash,
-            'issue': issue,
-            'category': category,
-            'first_seen': datetime.now().isoformat(),
-            'count': 1,
-            'last_seen': datetime.now().isoformat()
-        }
+        self.track_issues([(issue, category)])
+        
+    def track_issues(self, issues: Iterable[Tuple[str, str]]):
+        """Track a batch of (issue, category) pairs sharing one timestamp"""
+        now = datetime.now().isoformat()
+        historical_issues = self.session_data['historical_issues']
+        self._dirty.add('historical_issues')
         
-        # Check if issue already exists
-        for existing in self.session_data['historical_issues']:
-            if existing['hash'] == issue_hash:
+        for issue, category in issues:
+            issue_hash = _issue_hash(issue)
+            
+            # Check if issue already exists
+            existing = historical_issues.get(issue_hash)
+            if existing:
                 existing['count'] += 1
-                existing['last_seen'] = datetime.now().isoformat()
-                return
+                existing['last_seen'] = now
+                continue
                 
-        self.session_data['historical_issues'].append(issue_data)
+            historical_issues[issue_hash] = {
+                'hash': issue_hash,
+                'issue': issue,
+                'category': category,
+                'first_seen': now,
+                'count': 1,
+                'last_seen': now
+            }
+            
+        if len(historical_issues) > MAX_HISTORICAL_ISSUES:
+            self._compact_issues()
+            
+    def _compact_issues(self):
+        """Evict the least frequent (then least recent) issues"""
+        historical_issues = self.session_data['historical_issues']
+        excess = len(historical_issues) - HISTORICAL_ISSUES_LOW_WATER
+        evicted = heapq.nsmallest(
+            excess, historical_issues.values(),
+            key=lambda issue: (issue['count'], issue['last_seen'])
+        )
+        for issue in evicted:
+            del historical_issues[issue['hash']]
+        self._dirty.add('historical_issues')
         
     def get_recurring_issues(self, min_count: int = 3) -> List[Dict[str, Any]]:
         """Get issues that occur frequently"""
-        return [issue for issue in self.session_data['historical_issues'] 
+        return [issue for issue in self.session_data['historical_issues'].values()
                 if issue['count'] >= min_count]
 
 class ClaudeRuntimeIntegration:
@@ -145,35 +310,57 @@ class ClaudeRuntimeIntegration:
         self.config = self.load_config()
         self.session = SessionPersistence()
         self.runtime_dir = Path("claude-agent-runtime")
+        self._project_hash_cache: Optional[str] = None
+        self._http = None  # aiohttp.ClientSession, created on first use
         
     def load_config(self) -> Dict[str, Any]:
         """Load Claude Agent Runtime configuration"""
         try:
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return _load_yaml_config(self.config_path, os.path.getmtime(self.config_path))
         except Exception as e:
-            print(f"{RED}Error loading config: {e}{NC}")
+            cprint(RED, f"Error loading config: {e}")
             return {}
             
     def get_project_hash(self) -> str:
         """Generate hash of project state for change detection"""
-        import subprocess
+        if self._project_hash_cache is None:
+            self._project_hash_cache = self._compute_project_hash()
+        return self._project_hash_cache
+        
+    def _git_state(self) -> Tuple[str, str]:
+        """HEAD commit and working tree status, in-process via pygit2 when available"""
         try:
-            # Get git hash and list of modified files
+            import pygit2
+        except ImportError:
+            import subprocess
             git_hash = subprocess.check_output(['git', 'rev-parse', 'HEAD'], text=True).strip()
             git_status = subprocess.check_output(['git', 'status', '--porcelain'], text=True)
+            return git_hash, git_status
+            
+        repo = pygit2.Repository(pygit2.discover_repository('.'))
+        git_hash = str(repo.head.target)
+        git_status = ''.join(f"{flags} {path}\n" for path, flags in sorted(repo.status().items()))
+        return git_hash, git_status
+        
+    def _compute_project_hash(self) -> str:
+        try:
+            # Get git hash and list of modified files
+            git_hash, git_status = self._git_state()
             
-            # Include key files content
+            project_hash = hashlib.blake2b(digest_size=16)
+            project_hash.update(git_hash.encode())
+            project_hash.update(git_status.encode())
+            
+            # Include key files content, streamed in chunks
             key_files = ['package.json', 'src/App.tsx', 'api/generate.ts']
-            file_contents = []
             
             for file_path in key_files:
                 if os.path.exists(file_path):
-                    with open(file_path, 'r') as f:
-                        file_contents.append(f.read())
+                    with open(file_path, 'rb') as f:
+                        for chunk in iter(lambda: f.read(65536), b''):
+                            project_hash.update(chunk)
                         
-            combined = f"{git_hash}{git_status}{''.join(file_contents)}"
-            return hashlib.md5(combined.encode()).hexdigest()
+            return project_hash.hexdigest()
             
         except:
             # Fallback to timestamp if git not available
@@ -185,27 +372,29 @@ class ClaudeRuntimeIntegration:
         last_hash = self.session.session_data.get('last_run_hash', '')
         
         if current_hash != last_hash:
-            print(f"{CYAN}🔄 Project changes detected - running full diagnostics{NC}")
+            cprint(CYAN, "🔄 Project changes detected - running full diagnostics")
             return True
             
         # Run full diagnostics every 10th session
         session_count = self.session.session_data.get('session_count', 0)
         if session_count % 10 == 0:
-            print(f"{CYAN}🔄 Periodic full diagnostics (session #{session_count}){NC}")
+            cprint(CYAN, f"🔄 Periodic full diagnostics (session #{session_count})")
             return True
             
-        print(f"{GREEN}✓ No changes detected - running quick validation{NC}")
+        cprint(GREEN, "✓ No changes detected - running quick validation")
         return False
         
     async def run_intelligent_diagnostics(self) -> Dict[str, Any]:
         """Run AI-powered intelligent diagnostics"""
         start_time = time.time()
+        self._project_hash_cache = None
         
         # Update session tracking
         self.session.session_data['session_count'] += 1
+        self.session.mark_dirty('session_count')
         current_hash = self.get_project_hash()
         
-        print(f"\n{MAGENTA}🤖 CLAUDE AGENT RUNTIME DIAGNOSTICS{NC}")
+        cprint(MAGENTA, "\n🤖 CLAUDE AGENT RUNTIME DIAGNOSTICS")
         print("=" * 50)
         print(f"Session #{self.session.session_data['session_count']}")
         print(f"Project Hash: {current_hash[:8]}...")
@@ -224,7 +413,7 @@ class ClaudeRuntimeIntegration:
         }
         
         # Quick validation (always runs)
-        print(f"\n{BLUE}🚀 Running quick validation...{NC}")
+        cprint(BLUE, "\n🚀 Running quick validation...")
         quick_results = await self.run_quick_validation()
         results['quick_validation'] = quick_results
         
@@ -232,33 +421,35 @@ class ClaudeRuntimeIntegration:
         needs_full_scan = self.should_run_full_diagnostics()
         
         if needs_full_scan or not quick_results.get('passed', False):
-            print(f"\n{BLUE}🔬 Running comprehensive diagnostics...{NC}")
+            cprint(BLUE, "\n🔬 Running comprehensive diagnostics...")
             full_results = await self.run_full_diagnostics()
             results['full_diagnostics'] = full_results
             
             # Update session data
             self.session.session_data['last_run_hash'] = current_hash
+            self.session.mark_dirty('last_run_hash')
         else:
-            print(f"{GREEN}✓ Skipping full diagnostics - quick validation passed{NC}")
+            cprint(GREEN, "✓ Skipping full diagnostics - quick validation passed")
             
         # Performance analysis
-        print(f"\n{BLUE}📊 Analyzing performance trends...{NC}")
+        cprint(BLUE, "\n📊 Analyzing performance trends...")
         perf_analysis = self.analyze_performance_trends()
         results['performance_analysis'] = perf_analysis
         
         # Issue tracking
-        print(f"\n{BLUE}🔍 Analyzing issue patterns...{NC}")
+        cprint(BLUE, "\n🔍 Analyzing issue patterns...")
         issue_analysis = self.analyze_issue_patterns()
         results['issue_tracking'] = issue_analysis
         
         # Generate AI recommendations
-        print(f"\n{BLUE}💡 Generating intelligent recommendations...{NC}")
+        cprint(BLUE, "\n💡 Generating intelligent recommendations...")
         recommendations = self.generate_ai_recommendations(results)
         results['recommendations'] = recommendations
         
         # Update runtime tracking
         runtime = time.time() - start_time
         self.session.session_data['total_runtime'] += runtime
+        self.session.mark_dirty('total_runtime')
         results['runtime'] = runtime
         
         # Save session
@@ -266,6 +457,22 @@ class ClaudeRuntimeIntegration:
         
         return results
         
+    def get_http_session(self):
+        """Shared aiohttp session so connections are kept alive across checks"""
+        import aiohttp
+        
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=30)
+            )
+        return self._http
+        
+    async def aclose(self):
+        """Close the shared HTTP session"""
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+            
     async def run_quick_validation(self) -> Dict[str, Any]:
         """Run quick validation checks"""
         import aiohttp
@@ -277,24 +484,37 @@ class ClaudeRuntimeIntegration:
             'response_times': {}
         }
         
+        async def check_main_page(session):
+            start = time.time()
+            async with session.get("http://127.0.0.1:3000", timeout=aiohttp.ClientTimeout(total=5)) as response:
+                return 'main_page', 'server_running', time.time() - start, response.status == 200
+                
+        async def check_api(session):
+            start = time.time()
+            async with session.post("http://127.0.0.1:3000/api/generate", 
+                                  json={"words": "test", "mode": "emoji", "tone": "fun"},
+                                  timeout=aiohttp.ClientTimeout(total=10)) as response:
+                return 'api_endpoint', 'api_responding', time.time() - start, response.status in [200, 400, 429]
+        
         try:
-            # Check if server is running
-            async with aiohttp.ClientSession() as session:
-                start = time.time()
-                async with session.get("http://127.0.0.1:3000", timeout=aiohttp.ClientTimeout(total=5)) as response:
-                    results['response_times']['main_page'] = time.time() - start
-                    results['checks']['server_running'] = response.status == 200
-                    
-                # Quick API test
-                start = time.time()
-                async with session.post("http://127.0.0.1:3000/api/generate", 
-                                      json={"words": "test", "mode": "emoji", "tone": "fun"},
-                                      timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    results['response_times']['api_endpoint'] = time.time() - start
-                    results['checks']['api_responding'] = response.status in [200, 400, 429]
+            # Server and API checks are independent, so run them concurrently
+            session = self.get_http_session()
+            outcomes = await asyncio.gather(
+                check_main_page(session),
+                check_api(session),
+                return_exceptions=True
+            )
+                
+            for outcome in outcomes:
+                if isinstance(outcome, Exception):
+                    results['errors'].append(f"Quick validation failed: {str(outcome)}")
+                    continue
+                endpoint, check, response_time, ok = outcome
+                results['response_times'][endpoint] = response_time
+                results['checks'][check] = ok
                     
             # Overall validation
-            results['passed'] = all(results['checks'].values())
+            results['passed'] = not results['errors'] and all(results['checks'].values())
             
         except Exception as e:
             results['errors'].append(f"Quick validation failed: {str(e)}")
@@ -311,26 +531,27 @@ class ClaudeRuntimeIntegration:
             async with BrowserDiagnostics() as diagnostics:
                 report = await diagnostics.run_diagnostics("/")
                 
-                # Convert to dict format
+                # Convert to dict format; count log types in a single pass
+                log_counts = Counter(log.type for log in report.console_logs)
+                perf_dict = asdict(report.performance) if report.performance else {}
                 results = {
                     'passed': report.passed,
-                    'console_errors': len([log for log in report.console_logs if log.type == "error"]),
-                    'console_warnings': len([log for log in report.console_logs if log.type == "warning"]),
-                    'network_failures': len([r for r in report.network_requests if r.failed]),
+                    'console_errors': log_counts['error'],
+                    'console_warnings': log_counts['warning'],
+                    'network_failures': sum(1 for r in report.network_requests if r.failed),
                     'security_issues': len(report.security_issues),
-                    'performance_metrics': report.performance.__dict__ if report.performance else {},
+                    'performance_metrics': perf_dict,
                     'screenshots': report.screenshots
                 }
                 
                 # Track issues in session
-                for error in report.errors:
-                    self.session.track_issue(error, 'error')
-                for issue in report.security_issues:
-                    self.session.track_issue(issue, 'security')
+                self.session.track_issues(
+                    [(error, 'error') for error in report.errors] +
+                    [(issue, 'security') for issue in report.security_issues]
+                )
                     
                 # Update performance history
                 if report.performance:
-                    perf_dict = report.performance.__dict__
                     self.session.add_performance_datapoint(perf_dict)
                     self.session.update_baseline_metrics(perf_dict)
                     
@@ -346,12 +567,12 @@ class ClaudeRuntimeIntegration:
     def analyze_performance_trends(self) -> Dict[str, Any]:
         """Analyze performance trends from session data"""
         trends = self.session.get_performance_trends()
-        baseline = self.session.session_data.get('baseline_metrics', {}).get('performance', {})
+        baseline = self.session.get_baseline_metrics()
         
         return {
             'trends': trends,
             'baseline_metrics': baseline,
-            'data_points': len(self.session.session_data.get('performance_history', [])),
+            'data_points': len(self.session.session_data['performance_history']['timestamp']),
             'analysis': self.interpret_trends(trends)
         }
         
@@ -374,25 +595,23 @@ class ClaudeRuntimeIntegration:
         recurring = self.session.get_recurring_issues()
         
         # Categorize issues
-        categories = {}
+        categories: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         for issue in recurring:
-            cat = issue['category']
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(issue)
+            categories[issue['category']].append(issue)
             
         return {
             'recurring_issues': recurring,
             'issue_categories': categories,
-            'total_tracked': len(self.session.session_data.get('historical_issues', [])),
+            'total_tracked': len(self.session.session_data.get('historical_issues', {})),
             'recommendations': self.generate_issue_recommendations(recurring)
         }
         
     def generate_issue_recommendations(self, recurring_issues: List[Dict]) -> List[str]:
-        """Generate recommendations based on recurring issues"""
+        """Generate recommendations based on the most frequent recurring issues"""
         recommendations = []
         
-        for issue in recurring_issues:
+        top_issues = heapq.nlargest(MAX_RECOMMENDATIONS, recurring_issues, key=lambda issue: issue['count'])
+        for issue in top_issues:
             count = issue['count']
             category = issue['category']
             issue_text = issue['issue']
@@ -410,56 +629,57 @@ class ClaudeRuntimeIntegration:
         
     def generate_ai_recommendations(self, results: Dict[str, Any]) -> List[str]:
         """Generate AI-powered recommendations based on all diagnostic data"""
-        recommendations = []
+        recommendations = list(islice(self._iter_ai_recommendations(results), MAX_RECOMMENDATIONS))
         
+        # Default recommendations if none found
+        if not recommendations:
+            recommendations.extend([
+                "✅ All diagnostics passed - system is healthy",
+                "💡 Consider adding more comprehensive tests",
+                "📊 Monitor performance metrics regularly"
+            ])
+            
+        return recommendations
+        
+    def _iter_ai_recommendations(self, results: Dict[str, Any]) -> Iterator[str]:
+        """Yield recommendations in priority order so callers can stop early"""
         # Quick validation insights
         quick = results.get('quick_validation', {})
         if not quick.get('passed', False):
-            recommendations.append("🚨 CRITICAL: Quick validation failed - fix immediately")
+            yield "🚨 CRITICAL: Quick validation failed - fix immediately"
             
         # Response time analysis
         response_times = quick.get('response_times', {})
         for endpoint, time_ms in response_times.items():
             if time_ms > 2.0:
-                recommendations.append(f"⚡ Optimize {endpoint} - response time {time_ms:.2f}s is slow")
+                yield f"⚡ Optimize {endpoint} - response time {time_ms:.2f}s is slow"
                 
         # Full diagnostics insights
         full = results.get('full_diagnostics', {})
         if full.get('security_issues', 0) > 0:
-            recommendations.append("🔒 Security issues detected - review and fix before deployment")
+            yield "🔒 Security issues detected - review and fix before deployment"
             
         if full.get('console_errors', 0) > 0:
-            recommendations.append("🐛 Console errors found - check browser console")
+            yield "🐛 Console errors found - check browser console"
             
         # Performance trends
         perf = results.get('performance_analysis', {})
         for insight in perf.get('analysis', []):
             if '⚠️' in insight:
-                recommendations.append(f"📊 {insight}")
+                yield f"📊 {insight}"
                 
         # Issue patterns
         issues = results.get('issue_tracking', {})
-        for rec in issues.get('recommendations', []):
-            recommendations.append(rec)
+        yield from issues.get('recommendations', [])
             
         # Session-based recommendations
         session_count = self.session.session_data.get('session_count', 0)
         if session_count > 20:
-            recommendations.append("📈 Consider implementing automated monitoring - you've run many diagnostic sessions")
+            yield "📈 Consider implementing automated monitoring - you've run many diagnostic sessions"
             
-        # Default recommendations if none found
-        if not recommendations:
-            recommendations.extend([
-                "✅ All diagnostics passed - system is healthy",
-                "💡 Consider adding more comprehensive tests",
-                "📊 Monitor performance metrics regularly"
-            ])
-            
-        return recommendations
-        
     def print_results(self, results: Dict[str, Any]):
         """Print formatted results"""
-        print(f"\n{CYAN}📊 CLAUDE RUNTIME DIAGNOSTICS SUMMARY{NC}")
+        cprint(CYAN, "\n📊 CLAUDE RUNTIME DIAGNOSTICS SUMMARY")
         print("=" * 60)
         
         # Session info
@@ -476,7 +696,7 @@ class ClaudeRuntimeIntegration:
         # Performance trends
         perf = results['performance_analysis']
         if perf.get('trends'):
-            print(f"\n{MAGENTA}Performance Trends:{NC}")
+            cprint(MAGENTA, "\nPerformance Trends:")
             for insight in perf.get('analysis', []):
                 print(f"  {insight}")
                 
@@ -484,13 +704,13 @@ class ClaudeRuntimeIntegration:
         issues = results['issue_tracking']
         recurring_count = len(issues.get('recurring_issues', []))
         if recurring_count > 0:
-            print(f"\n{YELLOW}Recurring Issues: {recurring_count}{NC}")
+            cprint(YELLOW, f"\nRecurring Issues: {recurring_count}")
             
         # Recommendations
         recommendations = results['recommendations']
         if recommendations:
-            print(f"\n{CYAN}💡 AI Recommendations:{NC}")
-            for i, rec in enumerate(recommendations[:10], 1):  # Show top 10
+            cprint(CYAN, "\n💡 AI Recommendations:")
+            for i, rec in enumerate(recommendations, 1):
                 print(f"  {i}. {rec}")
                 
         # Overall status
@@ -498,11 +718,11 @@ class ClaudeRuntimeIntegration:
                          results.get('full_diagnostics', {}).get('passed', True))
         
         if overall_passed:
-            print(f"\n{GREEN}🎉 OVERALL STATUS: PASSED{NC}")
+            cprint(GREEN, "\n🎉 OVERALL STATUS: PASSED")
         else:
-            print(f"\n{RED}⚠️  OVERALL STATUS: NEEDS ATTENTION{NC}")
+            cprint(RED, "\n⚠️  OVERALL STATUS: NEEDS ATTENTION")
             
-        print(f"\n{BLUE}Session data saved for future runs{NC}")
+        cprint(BLUE, "\nSession data saved for future runs")
 
 async def main():
     """Main entry point"""
@@ -519,10 +739,13 @@ async def main():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_file = report_dir / f"claude_runtime_report_{timestamp}.json"
         
-        with open(report_file, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        if ORJSON_AVAILABLE:
+            report_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(results, f, indent=2, default=str)
             
-        print(f"\n{GREEN}Detailed report saved: {report_file}{NC}")
+        cprint(GREEN, f"\nDetailed report saved: {report_file}")
         
         # Exit with appropriate code
         quick_passed = results['quick_validation'].get('passed', False)
@@ -532,8 +755,11 @@ async def main():
         sys.exit(0 if overall_passed else 1)
         
     except Exception as e:
-        print(f"{RED}Claude Runtime Integration failed: {str(e)}{NC}")
+        cprint(RED, f"Claude Runtime Integration failed: {str(e)}")
         sys.exit(1)
+        
+    finally:
+        await integration.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
@@ -6,13 +6,33 @@ Tests API endpoints in both development and production environments
 to ensure functionality works across all deployment scenarios.
 """
 
+import asyncio
+import aiohttp
 import json
 import time
 import sys
 import os
-from urllib.request import urlopen, Request
-from urllib.parse import urlencode
-from urllib.error import URLError, HTTPError
+
+# Optional faster event loop; falls back to the default asyncio loop
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Optional faster JSON; the stdlib json module is used otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional compiled JSON schema validation; a hand-written check is used otherwise
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
 
 # Colors
 RED = '\033[0;31m'
@@ -23,6 +43,34 @@ CYAN = '\033[0;36m'
 MAGENTA = '\033[0;35m'
 NC = '\033[0m'
 
+# Skip color codes entirely when output is not a terminal (CI logs, pipes)
+if not sys.stdout.isatty():
+    RED = GREEN = YELLOW = BLUE = CYAN = MAGENTA = NC = ''
+
+def _json_dumps(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+# Both accept bytes, so response bodies never need decoding first
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# Expected shape of a /api/generate response
+COMBO_LIST_SCHEMA = {
+    "type": "array",
+    "items": {"type": "object", "required": ["combo", "name"]}
+}
+RESPONSE_SCHEMA = {
+    "type": "object",
+    "required": ["meta"],
+    "properties": {"emoji": COMBO_LIST_SCHEMA, "ascii": COMBO_LIST_SCHEMA},
+    "anyOf": [{"required": ["emoji"]}, {"required": ["ascii"]}]
+}
+
+# Compiled once to generated Python code
+validate_response_shape = fastjsonschema.compile(RESPONSE_SCHEMA) if FASTJSONSCHEMA_AVAILABLE else None
+
 class ProductionAPITester:
     def __init__(self):
         self.localhost_url = "http://127.0.0.1:3000"
@@ -50,27 +98,50 @@ class ProductionAPITester:
             }
         ]
         
-    def test_api_endpoint(self, base_url, test_case):
+        # Every environment gets the same payloads, so serialize them once
+        for test_case in self.test_payloads:
+            test_case["_body"] = _json_dumps(test_case["data"])
+            test_case["_headers"] = {
+                "Content-Type": "application/json",
+                "Content-Length": str(len(test_case["_body"]))
+            }
+        
+    async def test_api_endpoint(self, session, base_url, test_case):
         """Test a single API endpoint with given payload"""
         url = f"{base_url}/api/generate"
         
         try:
-            start_time = time.time()
-            
-            # Prepare request
-            post_data = json.dumps(test_case["data"]).encode('utf-8')
-            req = Request(url, data=post_data)
-            req.add_header('Content-Type', 'application/json')
-            req.add_header('User-Agent', 'EmojiFusion-ProductionTest/1.0')
+            start_time = time.perf_counter()
             
             # Make request
-            response = urlopen(req, timeout=15)
-            response_time = time.time() - start_time
-            status_code = response.getcode()
-            
-            # Read and parse response
-            response_text = response.read().decode('utf-8')
-            response_data = json.loads(response_text)
+            async with session.post(url, data=test_case["_body"],
+                                    headers=test_case["_headers"],
+                                    timeout=aiohttp.ClientTimeout(total=15)) as response:
+                response_time = time.perf_counter() - start_time
+                status_code = response.status
+                
+                if status_code == 500:
+                    return {
+                        "success": False,
+                        "status_code": status_code,
+                        "response_time": 0,
+                        "errors": [f"Server error (500) - likely LLM not configured"],
+                        "warnings": [],
+                        "response_data": None
+                    }
+                elif status_code >= 400:
+                    return {
+                        "success": False,
+                        "status_code": status_code,
+                        "response_time": 0,
+                        "errors": [f"HTTP Error: {status_code}"],
+                        "warnings": [],
+                        "response_data": None
+                    }
+                    
+                # Read and parse response
+                response_body = await response.read()
+            response_data = _json_loads(response_body)
             
             # Validate response structure
             errors = []
@@ -90,12 +161,13 @@ class ProductionAPITester:
             if not isinstance(response_data, dict):
                 errors.append("Response is not a JSON object")
             else:
-                # Check for expected fields
-                if "meta" not in response_data:
-                    errors.append("Missing 'meta' field in response")
-                    
-                if "emoji" not in response_data and "ascii" not in response_data:
-                    errors.append("Missing 'emoji' or 'ascii' fields in response")
+                if validate_response_shape is not None:
+                    try:
+                        validate_response_shape(response_data)
+                    except fastjsonschema.JsonSchemaException as e:
+                        errors.append(f"Invalid response shape: {e.message}")
+                else:
+                    self.check_response_shape(response_data, errors)
                     
                 # Check combo count
                 combo_count = 0
@@ -109,15 +181,6 @@ class ProductionAPITester:
                 elif combo_count < 3:
                     warnings.append(f"Low combo count: {combo_count}")
                     
-                # Validate combo structure
-                for combo_type in ["emoji", "ascii"]:
-                    if combo_type in response_data and isinstance(response_data[combo_type], list):
-                        for i, combo in enumerate(response_data[combo_type]):
-                            if not isinstance(combo, dict):
-                                errors.append(f"{combo_type}[{i}] is not an object")
-                            elif "combo" not in combo or "name" not in combo:
-                                errors.append(f"{combo_type}[{i}] missing combo or name field")
-                                
             return {
                 "success": len(errors) == 0,
                 "status_code": status_code,
@@ -127,26 +190,7 @@ class ProductionAPITester:
                 "response_data": response_data
             }
             
-        except HTTPError as e:
-            if e.code == 500:
-                return {
-                    "success": False,
-                    "status_code": e.code,
-                    "response_time": 0,
-                    "errors": [f"Server error (500) - likely LLM not configured"],
-                    "warnings": [],
-                    "response_data": None
-                }
-            else:
-                return {
-                    "success": False,
-                    "status_code": e.code,
-                    "response_time": 0,
-                    "errors": [f"HTTP Error: {e.code}"],
-                    "warnings": [],
-                    "response_data": None
-                }
-        except URLError as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             return {
                 "success": False,
                 "status_code": 0,
@@ -174,8 +218,26 @@ class ProductionAPITester:
                 "response_data": None
             }
             
-    def test_environment(self, base_url, env_name):
-        """Test all scenarios against a single environment"""
+    def check_response_shape(self, response_data, errors):
+        """Validate the response shape by hand when fastjsonschema is unavailable"""
+        # Check for expected fields
+        if "meta" not in response_data:
+            errors.append("Missing 'meta' field in response")
+            
+        if "emoji" not in response_data and "ascii" not in response_data:
+            errors.append("Missing 'emoji' or 'ascii' fields in response")
+            
+        # Validate combo structure
+        for combo_type in ["emoji", "ascii"]:
+            if combo_type in response_data and isinstance(response_data[combo_type], list):
+                for i, combo in enumerate(response_data[combo_type]):
+                    if not isinstance(combo, dict):
+                        errors.append(f"{combo_type}[{i}] is not an object")
+                    elif "combo" not in combo or "name" not in combo:
+                        errors.append(f"{combo_type}[{i}] missing combo or name field")
+                        
+    def test_environment(self, base_url, env_name, results):
+        """Report the results of all scenarios against a single environment"""
         print(f"\n{CYAN}🔍 Testing {env_name}: {base_url}{NC}")
         print("─" * 60)
         
@@ -189,10 +251,18 @@ class ProductionAPITester:
             "warnings": 0
         }
         
-        for test_case in self.test_payloads:
+        for test_case, result in zip(self.test_payloads, results):
             print(f"\n{BLUE}📋 {test_case['name']}{NC}")
             
-            result = self.test_api_endpoint(base_url, test_case)
+            if isinstance(result, BaseException):
+                result = {
+                    "success": False,
+                    "status_code": 0,
+                    "response_time": 0,
+                    "errors": [f"Unexpected error: {str(result)}"],
+                    "warnings": [],
+                    "response_data": None
+                }
             result["test_name"] = test_case["name"]
             env_results["tests"].append(result)
             env_results["total_tests"] += 1
@@ -215,36 +285,66 @@ class ProductionAPITester:
                 
         return env_results
         
-    def check_server_availability(self, url):
+    async def check_server_availability(self, session, url):
         """Check if a server is available"""
+        timeout = aiohttp.ClientTimeout(total=5)
         try:
-            response = urlopen(f"{url}/", timeout=5)
-            return response.getcode() == 200
+            # HEAD avoids rendering and transferring the page just to probe liveness
+            async with session.head(f"{url}/", timeout=timeout, allow_redirects=True) as response:
+                if response.status not in (405, 501):
+                    return response.status == 200
+            # HEAD not supported - ask for a single byte instead
+            async with session.get(f"{url}/", timeout=timeout, headers={"Range": "bytes=0-0"}) as response:
+                return response.status in (200, 206)
         except:
             return False
             
-    def run_comprehensive_test(self):
+    async def run_comprehensive_test(self):
         """Run tests against all environments"""
         print(f"{CYAN}🚀 PRODUCTION API TESTING SUITE{NC}")
         print("═" * 60)
         
         all_results = []
+        environments = [(self.localhost_url, "Development (Localhost)")]
+        environments += [(url, f"Production ({url})") for url in self.production_urls]
         
-        # Test localhost (development)
-        if self.check_server_availability(self.localhost_url):
-            dev_results = self.test_environment(self.localhost_url, "Development (Localhost)")
-            all_results.append(dev_results)
-        else:
-            print(f"\n{YELLOW}⚠️  Development server not running at {self.localhost_url}{NC}")
-            print(f"   Start with: {BLUE}npm run dev{NC}")
+        # One session per environment so each host gets its own connection pool
+        sessions = [
+            aiohttp.ClientSession(headers={"User-Agent": "EmojiFusion-ProductionTest/1.0"})
+            for _ in environments
+        ]
+        try:
+            available = await asyncio.gather(*(
+                self.check_server_availability(session, url)
+                for session, (url, _) in zip(sessions, environments)
+            ))
+            live = [
+                (session, url)
+                for session, (url, _), ok in zip(sessions, environments, available) if ok
+            ]
+            
+            # Fire every (environment x payload) request concurrently
+            outcomes = await asyncio.gather(*(
+                self.test_api_endpoint(session, url, test_case)
+                for session, url in live
+                for test_case in self.test_payloads
+            ), return_exceptions=True)
+        finally:
+            await asyncio.gather(*(session.close() for session in sessions))
             
-        # Test production environments
-        for prod_url in self.production_urls:
-            if self.check_server_availability(prod_url):
-                prod_results = self.test_environment(prod_url, f"Production ({prod_url})")
-                all_results.append(prod_results)
+        # Report in environment order
+        per_env = len(self.test_payloads)
+        offset = 0
+        for (url, env_name), ok in zip(environments, available):
+            if ok:
+                results = outcomes[offset:offset + per_env]
+                offset += per_env
+                all_results.append(self.test_environment(url, env_name, results))
+            elif url == self.localhost_url:
+                print(f"\n{YELLOW}⚠️  Development server not running at {self.localhost_url}{NC}")
+                print(f"   Start with: {BLUE}npm run dev{NC}")
             else:
-                print(f"\n{YELLOW}⚠️  Production server not accessible: {prod_url}{NC}")
+                print(f"\n{YELLOW}⚠️  Production server not accessible: {url}{NC}")
                 
         # Generate summary report
         self.generate_summary_report(all_results)
@@ -262,10 +362,13 @@ class ProductionAPITester:
             print(f"{RED}❌ No environments were accessible for testing{NC}")
             return
             
-        total_tests = sum(r["total_tests"] for r in all_results)
-        total_passed = sum(r["passed_tests"] for r in all_results)
-        total_failed = sum(r["failed_tests"] for r in all_results)
-        total_warnings = sum(r["warnings"] for r in all_results)
+        # Gather all totals in a single pass over the environments
+        total_tests = total_passed = total_failed = total_warnings = 0
+        for r in all_results:
+            total_tests += r["total_tests"]
+            total_passed += r["passed_tests"]
+            total_failed += r["failed_tests"]
+            total_warnings += r["warnings"]
         
         print(f"\n{MAGENTA}📈 Overall Statistics:{NC}")
         print(f"  Environments Tested: {len(all_results)}")
@@ -314,7 +417,7 @@ class ProductionAPITester:
 def main():
     """Main entry point"""
     tester = ProductionAPITester()
-    success = tester.run_comprehensive_test()
+    success = asyncio.run(tester.run_comprehensive_test())
     
     print(f"\n{CYAN}⏰ Testing completed{NC}")
     
@@ -326,4 +429,6 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     main()
\ No newline at end of file
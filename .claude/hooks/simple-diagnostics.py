@@ -5,26 +5,147 @@
 Demonstrates the diagnostic system without requiring external packages.
 """
 
+import asyncio
+import io
 import json
+import mmap
 import os
+import re
+import shutil
 import sys
 import time
 import subprocess
 import hashlib
+import http.client
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from urllib.request import urlopen
-from urllib.parse import urlencode
-from urllib.error import URLError
+from urllib.error import HTTPError
 
-# Colors
-RED = '\033[0;31m'
-GREEN = '\033[0;32m'
-YELLOW = '\033[1;33m'
-BLUE = '\033[0;34m'
-CYAN = '\033[0;36m'
-MAGENTA = '\033[0;35m'
-NC = '\033[0m'
+from _http_pool import (GREEN, YELLOW, BLUE, CYAN, MAGENTA, NC, OK, WARN, FAIL, log,
+                        json_dumps, json_loads, ORJSON_AVAILABLE, orjson, ConnectionPool)
+
+# Shared by every request to the local dev server
+DEV_HOST = '127.0.0.1'
+DEV_PORT = 3000
+_pool = ConnectionPool(DEV_HOST, DEV_PORT, maxsize=4)
+
+def _http_request(path, data=None, timeout=5, limit=None):
+    """Blocking request returning (status, body bytes); run via asyncio.to_thread"""
+    if data is not None:
+        method, headers = 'POST', {'Content-Type': 'application/json'}
+    else:
+        method, headers = 'GET', {}
+    status, response_headers, body = _pool.request(method, path, body=data, headers=headers,
+                                                   timeout=timeout, limit=limit)
+    if status >= 400:
+        # Keep urlopen's behaviour of raising on error statuses
+        raise HTTPError(f"http://{DEV_HOST}:{DEV_PORT}{path}", status,
+                        http.client.responses.get(status, ''), response_headers, None)
+    return status, body
+
+# GET probes of the dev server, shared by the health and performance checks
+PROBE_TTL = 30
+_probe_cache = {}
+_probe_lock = threading.Lock()
+
+def _cached_probe(path, ttl=PROBE_TTL):
+    """Blocking GET returning (status, body, elapsed ms), reused for ttl seconds"""
+    # The lock makes a concurrent caller wait for the first probe instead of repeating it
+    with _probe_lock:
+        now = time.monotonic()
+        cached = _probe_cache.get(path)
+        if cached and now - cached[0] < ttl:
+            return cached[1]
+        status, body = _http_request(path, limit=1000)
+        result = (status, body, (time.monotonic() - now) * 1000)
+        _probe_cache[path] = (now, result)
+        return result
+
+# Resolved once; an absolute executable path with no preexec_fn lets CPython
+# launch children through its vfork/posix_spawn fast path instead of fork+exec
+GIT = shutil.which('git') or 'git'
+
+async def run_command(*cmd):
+    """Run a command without blocking the event loop"""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+    )
+    stdout, stderr = await proc.communicate()
+    return subprocess.CompletedProcess(
+        cmd, proc.returncode, stdout.decode('utf-8', errors='ignore'), stderr.decode('utf-8', errors='ignore')
+    )
+
+# Directory sizes are cached on disk between runs, keyed on the directory's mtime.
+# Only top-level changes bump that mtime, so this is a cheap staleness check.
+SIZE_CACHE_FILE = 'diagnostics-reports/.size-cache.json'
+# Past this size node_modules is simply "large"; stop counting there
+DEPENDENCIES_SIZE_CAP = 500 * 1024 * 1024
+
+# Assignments that look like hardcoded credentials, matched in a single pass
+SECRET_PATTERN = re.compile(rb'(?i)(api[_-]?key|secret|password|token)\s*=')
+
+# Directory listings read so far; one scandir answers every existence check in it
+_dir_listings = {}
+
+def path_exists(path):
+    """os.path.exists backed by a cached listing of the parent directory"""
+    parent, name = os.path.split(path)
+    parent = parent or '.'
+    names = _dir_listings.get(parent)
+    if names is None:
+        try:
+            with os.scandir(parent) as it:
+                names = {entry.name for entry in it}
+        except OSError:
+            names = set()
+        _dir_listings[parent] = names
+    return name in names
+
+def dir_size(path, cap=None):
+    """Total size of the regular files under path, stopping once cap is exceeded"""
+    total = 0
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+                    if cap and total > cap:
+                        return cap
+    return total
+
+def cached_dir_size(path, cap=None):
+    """dir_size memoized in SIZE_CACHE_FILE"""
+    mtime_ns = os.stat(path).st_mtime_ns
+    try:
+        with open(SIZE_CACHE_FILE, 'r') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+        
+    entry = cache.get(path)
+    if entry and entry['mtime_ns'] == mtime_ns and entry['cap'] == cap:
+        return entry['size']
+        
+    size = dir_size(path, cap)
+    cache[path] = {'mtime_ns': mtime_ns, 'cap': cap, 'size': size}
+    os.makedirs(os.path.dirname(SIZE_CACHE_FILE), exist_ok=True)
+    with open(SIZE_CACHE_FILE, 'w') as f:
+        json.dump(cache, f)
+    return size
+
+def format_size(num_bytes):
+    """Human-readable size in the style of du -h"""
+    size = float(num_bytes)
+    for unit in ('B', 'K', 'M', 'G'):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if size >= 10 or unit == 'B' else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}T"
 
 def print_header():
     print(f"{CYAN}🚀 EMOJIFUSION DIAGNOSTICS WORKFLOW DEMO{NC}")
@@ -34,42 +155,41 @@ def print_header():
     print(f"Mode: Demonstration")
     print()
 
-def check_server_health():
+async def check_server_health(out):
     """Check if development server is running"""
-    print(f"{BLUE}🔍 Checking Development Server Health...{NC}")
-    print("-" * 40)
+    print(f"{BLUE}🔍 Checking Development Server Health...{NC}", file=out)
+    print("-" * 40, file=out)
     
     try:
-        response = urlopen('http://127.0.0.1:3000', timeout=5)
-        status_code = response.getcode()
+        status_code, body, _ = await asyncio.to_thread(_cached_probe, '/')
         
         if status_code == 200:
-            print(f"{GREEN}✅ Server Status: Running (HTTP {status_code}){NC}")
+            log(out, OK, f"Server Status: Running (HTTP {status_code})")
             
             # Read some content to verify it's actually serving the app
-            content = response.read(1000).decode('utf-8', errors='ignore')
+            content = body.decode('utf-8', errors='ignore')
             if 'emojifusion' in content.lower() or 'react' in content.lower():
-                print(f"{GREEN}✅ Content Check: EmojiFusion app detected{NC}")
+                log(out, OK, "Content Check: EmojiFusion app detected")
             else:
-                print(f"{YELLOW}⚠️  Content Check: Unknown content served{NC}")
+                log(out, WARN, "Content Check: Unknown content served")
                 
             return True
         else:
-            print(f"{RED}❌ Server returned status: {status_code}{NC}")
+            log(out, FAIL, f"Server returned status: {status_code}")
             return False
             
-    except URLError as e:
-        print(f"{RED}❌ Server not reachable: {str(e)}{NC}")
-        print(f"{YELLOW}💡 Start the server with: npm run dev{NC}")
+    except OSError as e:
+        log(out, FAIL, f"Server not reachable: {str(e)}")
+        print(f"{YELLOW}💡 Start the server with: npm run dev{NC}", file=out)
         return False
     except Exception as e:
-        print(f"{RED}❌ Health check failed: {str(e)}{NC}")
+        log(out, FAIL, f"Health check failed: {str(e)}")
         return False
 
-def test_api_endpoint():
+async def test_api_endpoint(out):
     """Test the main API endpoint"""
-    print(f"\n{BLUE}🔧 Testing API Endpoints...{NC}")
-    print("-" * 40)
+    print(f"\n{BLUE}🔧 Testing API Endpoints...{NC}", file=out)
+    print("-" * 40, file=out)
     
     try:
         # Test the generate API
@@ -79,41 +199,39 @@ def test_api_endpoint():
             'tone': 'fun'
         }
         
-        post_data = json.dumps(data).encode('utf-8')
-        req = urlopen(
-            'http://127.0.0.1:3000/api/generate',
+        post_data = json_dumps(data)
+        status_code, body = await asyncio.to_thread(
+            _http_request,
+            '/api/generate',
             data=post_data,
             timeout=10
         )
         
-        response_data = req.read().decode('utf-8')
-        status_code = req.getcode()
-        
-        print(f"{GREEN}✅ API Endpoint: /api/generate responding (HTTP {status_code}){NC}")
+        log(out, OK, f"API Endpoint: /api/generate responding (HTTP {status_code})")
         
         # Try to parse JSON response
         try:
-            json_response = json.loads(response_data)
+            json_response = json_loads(body)
             if 'result' in json_response or 'error' in json_response:
-                print(f"{GREEN}✅ Response Format: Valid JSON structure{NC}")
+                log(out, OK, "Response Format: Valid JSON structure")
             else:
-                print(f"{YELLOW}⚠️  Response Format: Unexpected JSON structure{NC}")
+                log(out, WARN, "Response Format: Unexpected JSON structure")
         except json.JSONDecodeError:
-            print(f"{YELLOW}⚠️  Response Format: Not valid JSON{NC}")
+            log(out, WARN, "Response Format: Not valid JSON")
             
         return True
         
-    except URLError as e:
-        print(f"{RED}❌ API request failed: {str(e)}{NC}")
+    except OSError as e:
+        log(out, FAIL, f"API request failed: {str(e)}")
         return False
     except Exception as e:
-        print(f"{RED}❌ API test error: {str(e)}{NC}")
+        log(out, FAIL, f"API test error: {str(e)}")
         return False
 
-def check_project_structure():
+async def check_project_structure(out):
     """Check project structure and key files"""
-    print(f"\n{BLUE}📁 Analyzing Project Structure...{NC}")
-    print("-" * 40)
+    print(f"\n{BLUE}📁 Analyzing Project Structure...{NC}", file=out)
+    print("-" * 40, file=out)
     
     critical_files = [
         'package.json',
@@ -125,10 +243,10 @@ def check_project_structure():
     
     all_good = True
     for file_path in critical_files:
-        if os.path.exists(file_path):
-            print(f"{GREEN}✅ {file_path}{NC}")
+        if path_exists(file_path):
+            log(out, OK, f"{file_path}")
         else:
-            print(f"{RED}❌ Missing: {file_path}{NC}")
+            log(out, FAIL, f"Missing: {file_path}")
             all_good = False
             
     # Check for security files
@@ -137,156 +255,165 @@ def check_project_structure():
         'vercel.json'
     ]
     
-    print(f"\n{MAGENTA}🔐 Security Configuration:{NC}")
+    print(f"\n{MAGENTA}🔐 Security Configuration:{NC}", file=out)
     for file_path in security_files:
-        if os.path.exists(file_path):
-            print(f"{GREEN}✅ {file_path}{NC}")
+        if path_exists(file_path):
+            log(out, OK, f"{file_path}")
         else:
-            print(f"{YELLOW}⚠️  Missing: {file_path}{NC}")
+            log(out, WARN, f"Missing: {file_path}")
             
     return all_good
 
-def check_git_status():
+async def check_git_status(out):
     """Check git repository status"""
-    print(f"\n{BLUE}📋 Git Repository Analysis...{NC}")
-    print("-" * 40)
+    print(f"\n{BLUE}📋 Git Repository Analysis...{NC}", file=out)
+    print("-" * 40, file=out)
     
     try:
-        # Check if we're in a git repo
-        result = subprocess.run(['git', 'rev-parse', '--git-dir'], 
-                              capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"{RED}❌ Not a git repository{NC}")
+        # Branch and working tree state in one call, last commit alongside it
+        status, last_log = await asyncio.gather(
+            run_command(GIT, 'status', '--porcelain=v2', '--branch', '-z'),
+            run_command(GIT, 'log', '-1', '--format=%h %s')
+        )
+        if status.returncode != 0:
+            log(out, FAIL, "Not a git repository")
             return False
             
+        branch = None
+        change_count = 0
+        entries = iter(status.stdout.split('\0'))
+        for entry in entries:
+            if entry.startswith('# branch.head '):
+                branch = entry[len('# branch.head '):]
+            elif entry and not entry.startswith('# '):
+                change_count += 1
+                if entry.startswith('2 '):
+                    next(entries, None)  # renames carry the original path as an extra field
+                    
         # Get current branch
-        result = subprocess.run(['git', 'branch', '--show-current'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            branch = result.stdout.strip()
-            print(f"{GREEN}✅ Current Branch: {branch}{NC}")
+        if branch is not None:
+            log(out, OK, f"Current Branch: {branch}")
             
         # Check for uncommitted changes
-        result = subprocess.run(['git', 'status', '--porcelain'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            changes = result.stdout.strip()
-            if changes:
-                change_count = len(changes.split('\n'))
-                print(f"{YELLOW}⚠️  Uncommitted Changes: {change_count} files{NC}")
-            else:
-                print(f"{GREEN}✅ Working Directory: Clean{NC}")
-                
+        if change_count:
+            log(out, WARN, f"Uncommitted Changes: {change_count} files")
+        else:
+            log(out, OK, "Working Directory: Clean")
+            
         # Get last commit info
-        result = subprocess.run(['git', 'log', '-1', '--oneline'], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            last_commit = result.stdout.strip()
-            print(f"{GREEN}✅ Last Commit: {last_commit}{NC}")
+        if last_log.returncode == 0:
+            last_commit = last_log.stdout.strip()
+            log(out, OK, f"Last Commit: {last_commit}")
             
         return True
         
     except Exception as e:
-        print(f"{RED}❌ Git analysis failed: {str(e)}{NC}")
+        log(out, FAIL, f"Git analysis failed: {str(e)}")
         return False
 
-def analyze_performance():
+async def analyze_performance(out):
     """Analyze basic performance indicators"""
-    print(f"\n{BLUE}⚡ Performance Analysis...{NC}")
-    print("-" * 40)
+    print(f"\n{BLUE}⚡ Performance Analysis...{NC}", file=out)
+    print("-" * 40, file=out)
     
     try:
         # Check bundle size if dist exists
-        if os.path.exists('dist'):
+        if path_exists('dist'):
             try:
-                result = subprocess.run(['du', '-sh', 'dist'], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    size = result.stdout.split()[0]
-                    print(f"{GREEN}✅ Build Size: {size}{NC}")
+                size = await asyncio.to_thread(cached_dir_size, 'dist')
+                log(out, OK, f"Build Size: {format_size(size)}")
             except:
-                print(f"{YELLOW}⚠️  Could not determine build size{NC}")
+                log(out, WARN, "Could not determine build size")
         else:
-            print(f"{YELLOW}ℹ️  No production build found (run: npm run build){NC}")
+            print(f"{YELLOW}ℹ️  No production build found (run: npm run build){NC}", file=out)
             
         # Check node_modules size
-        if os.path.exists('node_modules'):
+        if path_exists('node_modules'):
             try:
-                result = subprocess.run(['du', '-sh', 'node_modules'], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    size = result.stdout.split()[0]
-                    print(f"{GREEN}✅ Dependencies Size: {size}{NC}")
+                size = await asyncio.to_thread(cached_dir_size, 'node_modules', DEPENDENCIES_SIZE_CAP)
+                if size >= DEPENDENCIES_SIZE_CAP:
+                    size_text = f"over {format_size(DEPENDENCIES_SIZE_CAP)}"
+                else:
+                    size_text = format_size(size)
+                log(out, OK, f"Dependencies Size: {size_text}")
             except:
-                print(f"{YELLOW}⚠️  Could not determine dependencies size{NC}")
+                log(out, WARN, "Could not determine dependencies size")
                 
         # Test basic response time
-        start_time = time.time()
         try:
-            urlopen('http://127.0.0.1:3000', timeout=5)
-            response_time = (time.time() - start_time) * 1000
+            # Timed when the probe was made, so a cached health check probe still counts
+            _, _, response_time = await asyncio.to_thread(_cached_probe, '/')
             
             if response_time < 100:
-                print(f"{GREEN}✅ Response Time: {response_time:.0f}ms (Excellent){NC}")
+                log(out, OK, f"Response Time: {response_time:.0f}ms (Excellent)")
             elif response_time < 500:
-                print(f"{GREEN}✅ Response Time: {response_time:.0f}ms (Good){NC}")
+                log(out, OK, f"Response Time: {response_time:.0f}ms (Good)")
             else:
-                print(f"{YELLOW}⚠️  Response Time: {response_time:.0f}ms (Slow){NC}")
+                log(out, WARN, f"Response Time: {response_time:.0f}ms (Slow)")
         except:
-            print(f"{RED}❌ Could not measure response time{NC}")
+            log(out, FAIL, "Could not measure response time")
             
         return True
         
     except Exception as e:
-        print(f"{RED}❌ Performance analysis failed: {str(e)}{NC}")
+        log(out, FAIL, f"Performance analysis failed: {str(e)}")
         return False
 
-def security_scan():
+def _scan_file(file_path, pattern_re):
+    """Return the secret-scan issues for a single file"""
+    if not path_exists(file_path):
+        return []
+    try:
+        # Map the file instead of reading a lower-cased copy into memory
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if b'process.env' not in mm and pattern_re.search(mm):
+                return [f"Potential hardcoded secret in {file_path}"]
+    except:
+        pass
+    return []
+
+async def security_scan(out):
     """Basic security checks"""
-    print(f"\n{BLUE}🔐 Security Scan...{NC}")
-    print("-" * 40)
+    print(f"\n{BLUE}🔐 Security Scan...{NC}", file=out)
+    print("-" * 40, file=out)
     
     security_issues = []
     
     # Check for .env files that shouldn't be committed
     dangerous_files = ['.env', '.env.local', '.env.production']
     for file_path in dangerous_files:
-        if os.path.exists(file_path):
+        if path_exists(file_path):
             # Check if it's in git
-            result = subprocess.run(['git', 'ls-files', file_path], 
-                                  capture_output=True, text=True)
+            result = await run_command(GIT, 'ls-files', file_path)
             if result.returncode == 0 and result.stdout.strip():
                 security_issues.append(f"Environment file tracked in git: {file_path}")
                 
     # Check for potential secrets in common files
-    secret_patterns = ['api_key', 'secret', 'password', 'token']
     check_files = ['package.json', 'src/App.tsx', 'api/generate.ts']
     
-    for file_path in check_files:
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read().lower()
-                    for pattern in secret_patterns:
-                        if f'{pattern}=' in content and 'process.env' not in content:
-                            security_issues.append(f"Potential hardcoded secret in {file_path}")
-                            break
-            except:
-                pass
+    # File reads release the GIL, so scan the files side by side
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = await asyncio.gather(*(
+            loop.run_in_executor(executor, _scan_file, file_path, SECRET_PATTERN)
+            for file_path in check_files
+        ))
+    for issues in results:
+        security_issues.extend(issues)
                 
     # Report findings
     if security_issues:
-        print(f"{RED}❌ Security Issues Found: {len(security_issues)}{NC}")
+        log(out, FAIL, f"Security Issues Found: {len(security_issues)}")
         for issue in security_issues:
-            print(f"  • {issue}")
+            print(f"  • {issue}", file=out)
     else:
-        print(f"{GREEN}✅ No obvious security issues detected{NC}")
+        log(out, OK, "No obvious security issues detected")
         
     # Check for HTTPS in production
-    if os.path.exists('vercel.json'):
-        print(f"{GREEN}✅ Deployment Configuration: Present{NC}")
+    if path_exists('vercel.json'):
+        log(out, OK, "Deployment Configuration: Present")
     else:
-        print(f"{YELLOW}ℹ️  No deployment configuration found{NC}")
+        print(f"{YELLOW}ℹ️  No deployment configuration found{NC}", file=out)
         
     return len(security_issues) == 0
 
@@ -298,14 +425,14 @@ def generate_recommendations():
     recommendations = []
     
     # Check various aspects and generate recommendations
-    if not os.path.exists('dist'):
+    if not path_exists('dist'):
         recommendations.append("Run 'npm run build' to test production build")
         
-    if not os.path.exists('.env.example'):
+    if not path_exists('.env.example'):
         recommendations.append("Create .env.example with required environment variables")
         
     # Check package.json for security
-    if os.path.exists('package.json'):
+    if path_exists('package.json'):
         try:
             with open('package.json', 'r') as f:
                 package_data = json.load(f)
@@ -319,7 +446,7 @@ def generate_recommendations():
             
     # Git-based recommendations
     try:
-        result = subprocess.run(['git', 'status', '--porcelain'], 
+        result = subprocess.run([GIT, 'status', '--porcelain'], 
                               capture_output=True, text=True)
         if result.returncode == 0 and result.stdout.strip():
             recommendations.append("Commit pending changes before deployment")
@@ -340,13 +467,11 @@ def generate_recommendations():
         
     return recommendations
 
-def save_demo_report():
-    """Save a demo report"""
-    print(f"\n{BLUE}📊 Generating Demo Report...{NC}")
-    print("-" * 40)
-    
+def write_demo_report():
+    """Build and write the demo report; blocking, so keep it off the event loop"""
+    now = datetime.now()
     report = {
-        'timestamp': datetime.now().isoformat(),
+        'timestamp': now.isoformat(),
         'project': 'EmojiFusion',
         'version': 'diagnostics-demo',
         'summary': {
@@ -360,34 +485,51 @@ def save_demo_report():
     }
     
     os.makedirs('diagnostics-reports', exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     report_file = f"diagnostics-reports/demo_report_{timestamp}.json"
     
-    with open(report_file, 'w') as f:
-        json.dump(report, f, indent=2)
-        
-    print(f"{GREEN}✅ Demo report saved: {report_file}{NC}")
+    if ORJSON_AVAILABLE:
+        Path(report_file).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    else:
+        with open(report_file, 'w') as f:
+            json.dump(report, f, indent=2)
+            
     return report_file
 
-def main():
+async def save_demo_report():
+    """Save a demo report"""
+    return await asyncio.to_thread(write_demo_report)
+
+async def main():
     """Main demo workflow"""
     print_header()
     
-    # Run diagnostic components
-    results = {
-        'server_health': check_server_health(),
-        'api_test': test_api_endpoint(),
-        'structure_check': check_project_structure(),
-        'git_analysis': check_git_status(),
-        'performance': analyze_performance(),
-        'security': security_scan()
+    # Run diagnostic components concurrently; each writes to its own buffer
+    checks = {
+        'server_health': check_server_health,
+        'api_test': test_api_endpoint,
+        'structure_check': check_project_structure,
+        'git_analysis': check_git_status,
+        'performance': analyze_performance,
+        'security': security_scan
     }
+    buffers = {name: io.StringIO() for name in checks}
+    outcomes = await asyncio.gather(*(check(buffers[name]) for name, check in checks.items()))
+    results = dict(zip(checks, outcomes))
+    
+    # Print component output in a stable order
+    for buf in buffers.values():
+        sys.stdout.write(buf.getvalue())
     
-    # Generate recommendations
-    recommendations = generate_recommendations()
+    # Generate recommendations while the demo report is written
+    report_file, recommendations = await asyncio.gather(
+        save_demo_report(),
+        asyncio.to_thread(generate_recommendations)
+    )
     
-    # Save demo report
-    report_file = save_demo_report()
+    print(f"\n{BLUE}📊 Generating Demo Report...{NC}")
+    print("-" * 40)
+    print(f"{GREEN}✅ Demo report saved: {report_file}{NC}")
     
     # Summary
     print(f"\n{CYAN}📋 WORKFLOW DEMO SUMMARY{NC}")
@@ -425,5 +567,5 @@ def main():
     return passed_count == total_count
 
 if __name__ == "__main__":
-    success = main()
+    success = asyncio.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
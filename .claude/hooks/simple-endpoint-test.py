@@ -5,176 +5,188 @@
 Demonstrates endpoint testing without external dependencies.
 """
 
+import asyncio
+import http.client
+import io
 import json
 import time
 import sys
-from urllib.request import urlopen, Request
-from urllib.parse import urlencode
-from urllib.error import URLError, HTTPError
+from urllib.parse import urlsplit
+from urllib.error import HTTPError
 
-# Colors
-RED = '\033[0;31m'
-GREEN = '\033[0;32m'
-YELLOW = '\033[1;33m'
-BLUE = '\033[0;34m'
-CYAN = '\033[0;36m'
-NC = '\033[0m'
+from _http_pool import (GREEN, YELLOW, BLUE, CYAN, NC, OK, WARN, FAIL, log,
+                        json_dumps, json_loads, ConnectionPool)
 
-def test_endpoint(name, url, method='GET', data=None, headers=None, expected_status=None):
-    """Test a single endpoint"""
-    print(f"\n{BLUE}🔍 Testing: {name}{NC}")
-    print("-" * 40)
+# Shared by every request to the local dev server
+DEV_HOST = '127.0.0.1'
+DEV_PORT = 3000
+_pool = ConnectionPool(DEV_HOST, DEV_PORT, maxsize=6)
+
+def build_tester(name, url, method='GET', data=None, headers=None, expected_status=None):
+    """Build a coroutine function testing one endpoint, with its fixed settings resolved up front"""
+    # Prepare request
+    if method == 'POST' and data:
+        request_method = 'POST'
+        post_data = json_dumps(data)
+        req_headers = {'Content-Type': 'application/json'}
+    else:
+        # Without a body the request goes out as a plain GET, as urlopen did
+        request_method = 'GET'
+        post_data = None
+        req_headers = {}
+        
+    if headers:
+        req_headers.update(headers)
+        
+    path = urlsplit(url).path or '/'
+    check_json = method == 'POST' and 'api' in url
+    expected_status = expected_status or None
     
-    try:
-        start_time = time.time()
+    async def run(out):
+        print(f"\n{BLUE}🔍 Testing: {name}{NC}", file=out)
+        print("-" * 40, file=out)
         
-        # Prepare request
-        if method == 'POST' and data:
-            post_data = json.dumps(data).encode('utf-8')
-            req = Request(url, data=post_data)
-            req.add_header('Content-Type', 'application/json')
-        else:
-            req = Request(url)
-            
-        if headers:
-            for key, value in headers.items():
-                req.add_header(key, value)
-                
-        # Make request
         try:
-            response = urlopen(req, timeout=10)
-            status_code = response.getcode()
-            response_time = (time.time() - start_time) * 1000
+            start_time = time.time()
             
-            # Read response
-            content = response.read(1000).decode('utf-8', errors='ignore')
-            
-            # Check status
-            if expected_status and status_code not in expected_status:
-                print(f"{RED}❌ Status: {status_code} (expected {expected_status}){NC}")
-                return False
-            else:
-                print(f"{GREEN}✅ Status: {status_code}{NC}")
+            # Make request over the shared keep-alive pool
+            try:
+                status_code, response_headers, body = await asyncio.to_thread(
+                    _pool.request, request_method, path, body=post_data, headers=req_headers, timeout=10,
+                    limit=1000
+                )
+                response_time = (time.time() - start_time) * 1000
+                if status_code >= 400:
+                    raise HTTPError(url, status_code, http.client.responses.get(status_code, ''),
+                                    response_headers, None)
                 
-            # Check response time
-            if response_time < 1000:
-                print(f"{GREEN}✅ Response Time: {response_time:.0f}ms{NC}")
-            elif response_time < 3000:
-                print(f"{YELLOW}⚠️  Response Time: {response_time:.0f}ms (slow){NC}")
-            else:
-                print(f"{RED}❌ Response Time: {response_time:.0f}ms (too slow){NC}")
+                # Read response
+                content = body.decode('utf-8', errors='ignore')
                 
-            # Check content
-            if method == 'POST' and 'api' in url:
-                try:
-                    json_data = json.loads(content)
-                    if 'result' in json_data or 'error' in json_data:
-                        print(f"{GREEN}✅ Response Format: Valid JSON{NC}")
+                # Check status
+                if expected_status and status_code not in expected_status:
+                    log(out, FAIL, f"Status: {status_code} (expected {sorted(expected_status)})")
+                    return False
+                else:
+                    log(out, OK, f"Status: {status_code}")
+                    
+                # Check response time
+                if response_time < 1000:
+                    log(out, OK, f"Response Time: {response_time:.0f}ms")
+                elif response_time < 3000:
+                    log(out, WARN, f"Response Time: {response_time:.0f}ms (slow)")
+                else:
+                    log(out, FAIL, f"Response Time: {response_time:.0f}ms (too slow)")
+                    
+                # Check content
+                if check_json:
+                    try:
+                        json_data = json_loads(content)
+                        if 'result' in json_data or 'error' in json_data:
+                            log(out, OK, "Response Format: Valid JSON")
+                        else:
+                            log(out, WARN, "Response Format: Unexpected structure")
+                    except json.JSONDecodeError:
+                        log(out, WARN, "Response Format: Not JSON")
+                else:
+                    if len(content) > 100:
+                        log(out, OK, f"Content: Received {len(content)} characters")
                     else:
-                        print(f"{YELLOW}⚠️  Response Format: Unexpected structure{NC}")
-                except json.JSONDecodeError:
-                    print(f"{YELLOW}⚠️  Response Format: Not JSON{NC}")
-            else:
-                if len(content) > 100:
-                    print(f"{GREEN}✅ Content: Received {len(content)} characters{NC}")
+                        log(out, WARN, f"Content: Short response ({len(content)} chars)")
+                        
+                # Check headers
+                headers_dict = dict(response_headers)
+                if 'Content-Type' in headers_dict:
+                    content_type = headers_dict['Content-Type']
+                    log(out, OK, f"Content-Type: {content_type}")
                 else:
-                    print(f"{YELLOW}⚠️  Content: Short response ({len(content)} chars){NC}")
+                    log(out, WARN, "Missing Content-Type header")
                     
-            # Check headers
-            headers_dict = dict(response.headers)
-            if 'Content-Type' in headers_dict:
-                content_type = headers_dict['Content-Type']
-                print(f"{GREEN}✅ Content-Type: {content_type}{NC}")
-            else:
-                print(f"{YELLOW}⚠️  Missing Content-Type header{NC}")
-                
-            return True
-            
-        except HTTPError as e:
-            status_code = e.code
-            response_time = (time.time() - start_time) * 1000
-            
-            print(f"{RED}❌ HTTP Error: {status_code}{NC}")
-            print(f"{YELLOW}Response Time: {response_time:.0f}ms{NC}")
-            
-            # For some endpoints, 404 might be expected
-            if expected_status and status_code in expected_status:
-                print(f"{GREEN}✅ Expected error status{NC}")
                 return True
                 
+            except HTTPError as e:
+                status_code = e.code
+                response_time = (time.time() - start_time) * 1000
+                
+                log(out, FAIL, f"HTTP Error: {status_code}")
+                print(f"{YELLOW}Response Time: {response_time:.0f}ms{NC}", file=out)
+                
+                # For some endpoints, 404 might be expected
+                if expected_status and status_code in expected_status:
+                    log(out, OK, "Expected error status")
+                    return True
+                    
+                return False
+                
+        except OSError as e:
+            log(out, FAIL, f"Connection Error: {str(e)}")
+            return False
+        except Exception as e:
+            log(out, FAIL, f"Test Error: {str(e)}")
             return False
             
-    except URLError as e:
-        print(f"{RED}❌ Connection Error: {str(e)}{NC}")
-        return False
-    except Exception as e:
-        print(f"{RED}❌ Test Error: {str(e)}{NC}")
-        return False
+    return run
 
-def main():
+async def main():
     """Run endpoint testing demo"""
     print(f"{CYAN}🔧 ENDPOINT TESTING SYSTEM DEMO{NC}")
     print("=" * 50)
     
     base_url = "http://127.0.0.1:3000"
     
-    # Test definitions
+    # Test definitions; expected statuses are frozensets for constant-time lookups
     tests = [
         {
             'name': 'Main Application Page',
             'url': f'{base_url}/',
             'method': 'GET',
-            'expected_status': [200]
+            'expected_status': frozenset((200,))
         },
         {
             'name': 'API Generate Endpoint',
             'url': f'{base_url}/api/generate',
             'method': 'POST',
             'data': {'words': 'test', 'mode': 'emoji', 'tone': 'fun'},
-            'expected_status': [200, 400, 429]
+            'expected_status': frozenset((200, 400, 429))
         },
         {
             'name': 'Static Manifest File',
             'url': f'{base_url}/manifest.webmanifest',
             'method': 'GET',
-            'expected_status': [200]
+            'expected_status': frozenset((200,))
         },
         {
             'name': 'Service Worker',
             'url': f'{base_url}/sw.js',
             'method': 'GET',
-            'expected_status': [200]
+            'expected_status': frozenset((200,))
         },
         {
             'name': '404 Error Handling',
             'url': f'{base_url}/nonexistent-page',
             'method': 'GET',
-            'expected_status': [404]
+            'expected_status': frozenset((404,))
         },
         {
             'name': 'API Invalid Request',
             'url': f'{base_url}/api/generate',
             'method': 'POST',
             'data': {},  # Empty data should cause error
-            'expected_status': [400]
+            'expected_status': frozenset((400,))
         }
     ]
     
-    # Run tests
-    passed = 0
-    total = len(tests)
+    # Specialize a tester per definition, then run them all concurrently;
+    # each writes to its own buffer
+    runners = [build_tester(**test) for test in tests]
+    total = len(runners)
+    buffers = [io.StringIO() for _ in runners]
+    outcomes = await asyncio.gather(*(run(buf) for buf, run in zip(buffers, runners)))
     
-    for test in tests:
-        success = test_endpoint(
-            test['name'],
-            test['url'],
-            test.get('method', 'GET'),
-            test.get('data'),
-            test.get('headers'),
-            test.get('expected_status')
-        )
-        if success:
-            passed += 1
+    # Print test output in definition order
+    for buf in buffers:
+        sys.stdout.write(buf.getvalue())
+    passed = sum(1 for success in outcomes if success)
             
     # Summary
     print(f"\n{CYAN}📊 ENDPOINT TESTING SUMMARY{NC}")
@@ -206,5 +218,5 @@ def main():
     return passed == total
 
 if __name__ == "__main__":
-    success = main()
+    success = asyncio.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file
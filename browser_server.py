@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Warm Browser Server
+Keeps one Chromium running so repeated test runs can skip the cold start
+
+Start it once, then point the test scripts at it:
+    python browser_server.py
+    BROWSER_CDP_URL=http://127.0.0.1:9222 python test-contact-submission.py
+"""
+
+import sys
+import os
+import asyncio
+import argparse
+
+# Set UTF-8 encoding for Windows console
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+from playwright.async_api import async_playwright
+
+async def serve(port, headless):
+    """Launch Chromium with its CDP endpoint open and keep it running"""
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(
+            headless=headless,
+            args=[f"--remote-debugging-port={port}", "--remote-debugging-address=127.0.0.1"]
+        )
+        print(f"✅ Chromium ready at http://127.0.0.1:{port}")
+        print(f"   Set BROWSER_CDP_URL=http://127.0.0.1:{port} for the test scripts")
+        print("   Press Ctrl+C to stop")
+        try:
+            # Tests only open and close their own contexts on this browser
+            await asyncio.Event().wait()
+        finally:
+            await browser.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep a warm Chromium for the browser tests")
+    parser.add_argument("--port", type=int, default=9222, help="CDP port (default: 9222)")
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(serve(args.port, not args.headed))
+    except KeyboardInterrupt:
+        print("\n🧹 Browser server stopped")
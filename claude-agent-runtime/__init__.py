@@ -10,6 +10,6 @@ __version__ = "1.0.0"
 __author__ = "Claude Agent Runtime"
 
 from .core.agent import ClaudeAgent
-from .drivers.playwright_driver import BrowserDriver
+from .drivers.playwright_driver import BrowserDriver, BrowserPool
 
-__all__ = ["ClaudeAgent", "BrowserDriver"]
+__all__ = ["ClaudeAgent", "BrowserDriver", "BrowserPool"]
@@ -3,11 +3,15 @@ ClaudeAgent - Core AI Agent Interface
 Provides structured interaction patterns for browser automation
 """
 
-import asyncio
-from typing import Optional, Dict, Any, List
+from collections import deque
+from typing import Optional, Dict, Any, List, Deque
 from datetime import datetime
 
 
+# One id per process; agents created in the same run share it
+_SESSION_ID = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+
 class ClaudeAgent:
     """
     Core agent class for managing browser automation tasks
@@ -24,8 +28,9 @@ class ClaudeAgent:
         """
         self.driver = driver
         self.config = config or {}
-        self.task_history: List[Dict[str, Any]] = []
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Bounded so long-running sessions don't grow without limit
+        self.task_history: Deque[Dict[str, Any]] = deque(maxlen=self.config.get("history_size", 1000))
+        self.session_id = _SESSION_ID
 
     async def initialize(self):
         """Initialize the agent and browser driver"""
@@ -96,24 +101,35 @@ class ClaudeAgent:
         if not self.driver:
             return {"error": "No driver initialized"}
 
+        # Tally tags in a single walk of the DOM rather than one query per kind
         analysis = await self.driver.eval("""
-            ({
-                title: document.title,
-                url: window.location.href,
-                elementCounts: {
-                    buttons: document.querySelectorAll('button').length,
-                    inputs: document.querySelectorAll('input, textarea').length,
-                    forms: document.querySelectorAll('form').length,
-                    links: document.querySelectorAll('a').length,
-                    images: document.querySelectorAll('img').length,
-                    total: document.querySelectorAll('*').length
-                },
-                viewport: {
-                    width: window.innerWidth,
-                    height: window.innerHeight
-                },
-                readyState: document.readyState
-            })
+            () => {
+                const all = document.getElementsByTagName('*');
+                let buttons = 0, inputs = 0, forms = 0, links = 0, images = 0;
+                for (let i = 0; i < all.length; i++) {
+                    switch (all[i].tagName) {
+                        case 'BUTTON': buttons++; break;
+                        case 'INPUT':
+                        case 'TEXTAREA': inputs++; break;
+                        case 'FORM': forms++; break;
+                        case 'A': links++; break;
+                        case 'IMG': images++; break;
+                    }
+                }
+                return {
+                    title: document.title,
+                    url: window.location.href,
+                    elementCounts: {
+                        buttons, inputs, forms, links, images,
+                        total: all.length
+                    },
+                    viewport: {
+                        width: window.innerWidth,
+                        height: window.innerHeight
+                    },
+                    readyState: document.readyState
+                };
+            }
         """)
 
         return analysis
@@ -128,7 +144,8 @@ class ClaudeAgent:
         Args:
             condition: JavaScript expression that evaluates to boolean
             timeout: Maximum wait time in seconds
-            interval: Check interval in seconds
+            interval: Unused; kept for compatibility. The driver waits in
+                the browser and wakes as soon as the condition is met.
 
         Returns:
             True if condition met, False if timeout
@@ -136,23 +153,15 @@ class ClaudeAgent:
         if not self.driver:
             return False
 
-        elapsed = 0
-        while elapsed < timeout:
-            result = await self.driver.eval(condition)
-            if result:
-                return True
-            await asyncio.sleep(interval)
-            elapsed += interval
-
-        return False
+        return await self.driver.wait_for_condition(condition, timeout)
 
     async def get_task_history(self) -> List[Dict[str, Any]]:
         """Get the agent's task execution history"""
-        return self.task_history
+        return list(self.task_history)
 
     async def clear_history(self):
         """Clear the task history"""
-        self.task_history = []
+        self.task_history.clear()
 
     async def cleanup(self):
         """Clean up resources"""
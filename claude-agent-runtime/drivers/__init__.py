@@ -1,4 +1,4 @@
 """Browser driver implementations"""
-from .playwright_driver import BrowserDriver
+from .playwright_driver import BrowserDriver, BrowserPool
 
-__all__ = ["BrowserDriver"]
+__all__ = ["BrowserDriver", "BrowserPool"]
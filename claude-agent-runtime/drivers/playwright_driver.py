@@ -4,9 +4,13 @@ High-level browser automation with console diagnostics
 """
 
 import asyncio
-from typing import Optional, List, Dict, Any
+from collections import deque
+from typing import Optional, List, Dict, Any, Iterable, Callable, Union, Deque
 from datetime import datetime
+from urllib.parse import urlsplit
 import base64
+import hashlib
+import json
 import os
 
 
@@ -20,18 +24,103 @@ except ImportError:
     BrowserContext = None
 
 
+# Subresources worth skipping for DOM-only checks; pass as block_resources to
+# opt in. Not the default, since screenshots would lose images and web fonts
+DEFAULT_BLOCKED_RESOURCES = frozenset({"image", "font", "media"})
+
+
+# Walks inputs, textareas and buttons once instead of one querySelector per check
+_FORM_SHAPE_JS = """
+() => {
+    const shape = {
+        hasForm: !!document.querySelector('form'),
+        hasNameField: false,
+        hasEmailField: false,
+        hasMessageField: false,
+        hasSubmitButton: false,
+        inputCount: 0,
+        textareaCount: 0,
+        buttonCount: 0
+    };
+    for (const el of document.querySelectorAll('input, textarea, button')) {
+        const name = el.getAttribute('name');
+        const type = (el.getAttribute('type') || '').toLowerCase();
+        if (el.tagName === 'INPUT') {
+            shape.inputCount++;
+            if (name === 'name' || el.id === 'name') shape.hasNameField = true;
+            if (name === 'email' || el.id === 'email' || type === 'email') shape.hasEmailField = true;
+            if (type === 'submit') shape.hasSubmitButton = true;
+        } else if (el.tagName === 'TEXTAREA') {
+            shape.textareaCount++;
+            if (name === 'message' || el.id === 'message') shape.hasMessageField = true;
+        } else {
+            shape.buttonCount++;
+            if (type === 'submit') shape.hasSubmitButton = true;
+        }
+    }
+    return shape;
+}
+"""
+
+
+# Sets each field's value and fires the events typing would; returns unmatched selectors
+_FILL_MANY_JS = """
+(fields) => {
+    const missing = [];
+    for (const [selector, value] of Object.entries(fields)) {
+        const el = document.querySelector(selector);
+        if (!el) {
+            missing.push(selector);
+            continue;
+        }
+        el.value = value;
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+    }
+    return missing;
+}
+"""
+
+
+def _browser_launcher(playwright, browser_type: str):
+    """Select the Playwright browser type to launch"""
+    if browser_type == "firefox":
+        return playwright.firefox
+    if browser_type == "webkit":
+        return playwright.webkit
+    return playwright.chromium
+
+
+async def _start_browser(playwright, browser_type: str, headless: bool,
+                         cdp_endpoint: Optional[str] = None):
+    """Connect to an already running Chromium when given its endpoint, else launch one"""
+    if cdp_endpoint and browser_type == "chromium":
+        try:
+            return await playwright.chromium.connect_over_cdp(cdp_endpoint, timeout=5000)
+        except Exception as e:
+            print(f"Could not connect to {cdp_endpoint}, launching a browser instead: {e}")
+    return await _browser_launcher(playwright, browser_type).launch(headless=headless)
+
+
 class BrowserDriver:
     """
     Playwright-based browser driver with console monitoring
     and screenshot capabilities
     """
 
-    def __init__(self, browser_type: str = "chromium"):
+    def __init__(self, browser_type: str = "chromium",
+                 console_sink: Optional[Callable[[List[str]], None]] = None,
+                 max_logs: int = 5000):
         """
         Initialize browser driver
 
         Args:
             browser_type: Browser type (chromium, firefox, webkit)
+            console_sink: Optional callback receiving console entries in
+                batches (e.g. ConsoleDiagnostics.add_logs); entries sent
+                there are not also kept by the driver
+            max_logs: Console entries kept by the driver; the oldest are
+                dropped once the limit is reached
         """
         if not PLAYWRIGHT_AVAILABLE:
             raise ImportError(
@@ -44,33 +133,60 @@ class BrowserDriver:
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
         self.initialized = False
-        self._console_logs: List[str] = []
+        self._console_logs: Deque[str] = deque(maxlen=max_logs)
+        self._console_sink = console_sink
+        # Console entries are queued by the page handlers and delivered in batches
+        self._console_queue: Optional[asyncio.Queue] = None
+        self._drain_task: Optional[asyncio.Task] = None
+        # CDP session and source -> scriptId for compile_script(), Chromium only
+        self._cdp = None
+        self._compiled: Dict[str, str] = {}
         self._screenshot_dir = "screenshots"
-
-    async def init(self, headless: bool = True, viewport: Optional[Dict[str, int]] = None):
+        # Default screenshot names: session start time plus a running number
+        self._session_prefix = ""
+        self._shot_seq = 0
+        # Digest of the last screenshot_if_changed() capture, reset on navigate()
+        self._last_shot_hash: Optional[str] = None
+        self._blocked_resources = frozenset()
+        self._blocked_domains = ()
+        # False for drivers handed out by a BrowserPool, which owns the browser
+        self._owns_browser = True
+        # False when init() was handed someone else's Playwright instance
+        self._owns_playwright = True
+
+    async def init(self, headless: bool = True, viewport: Optional[Dict[str, int]] = None,
+                   block_resources: Optional[Iterable[str]] = None,
+                   block_domains: Optional[Iterable[str]] = None,
+                   playwright=None, cdp_endpoint: Optional[str] = None):
         """
         Initialize the browser
 
         Args:
             headless: Run browser in headless mode
             viewport: Viewport size dict with 'width' and 'height'
+            block_resources: Resource types to abort (image, font, media, ...),
+                e.g. DEFAULT_BLOCKED_RESOURCES; everything loads when None
+            block_domains: Hosts whose requests are aborted, subdomains included
+            playwright: Already started Playwright instance to reuse instead of
+                starting another driver process; left running by close()
+            cdp_endpoint: URL of a running Chromium (e.g. browser_server.py) to
+                connect to instead of launching one; falls back to a launch
         """
         if self.initialized:
             return
 
-        self.playwright = await async_playwright().start()
+        self._owns_playwright = playwright is None
+        self.playwright = playwright or await async_playwright().start()
 
-        # Select browser type
-        if self.browser_type == "firefox":
-            browser_launcher = self.playwright.firefox
-        elif self.browser_type == "webkit":
-            browser_launcher = self.playwright.webkit
-        else:
-            browser_launcher = self.playwright.chromium
+        # Launch browser, or reuse a warm one
+        self.browser = await _start_browser(self.playwright, self.browser_type, headless, cdp_endpoint)
 
-        # Launch browser
-        self.browser = await browser_launcher.launch(headless=headless)
+        await self._open_context(viewport, block_resources, block_domains)
 
+    async def _open_context(self, viewport: Optional[Dict[str, int]],
+                            block_resources: Optional[Iterable[str]],
+                            block_domains: Optional[Iterable[str]]):
+        """Create this driver's context and page on the already launched browser"""
         # Create context with viewport
         viewport_size = viewport or {"width": 1280, "height": 720}
         self.context = await self.browser.new_context(
@@ -78,36 +194,102 @@ class BrowserDriver:
             locale="en-US",
             timezone_id="America/New_York"
         )
+        # domcontentloaded navigations rarely need long; fail fast instead of hanging
+        self.context.set_default_navigation_timeout(15000)
+
+        # Only route through Python when there is something to block
+        self._blocked_resources = frozenset(block_resources or ())
+        self._blocked_domains = tuple(block_domains or ())
+        if self._blocked_resources or self._blocked_domains:
+            await self.context.route("**/*", self._route_request)
 
         # Create page
         self.page = await self.context.new_page()
 
+        self._session_prefix = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._shot_seq = 0
+
         # Set up console monitoring
+        self._console_queue = asyncio.Queue()
+        self._drain_task = asyncio.create_task(self._drain_console())
         self.page.on("console", self._handle_console)
         self.page.on("pageerror", self._handle_page_error)
-
-        # Ensure screenshot directory exists
-        os.makedirs(self._screenshot_dir, exist_ok=True)
+        self.page.on("framenavigated", self._handle_frame_navigated)
 
         self.initialized = True
 
+    def _is_blocked_host(self, url: str) -> bool:
+        """Check whether a request URL belongs to a blocked domain"""
+        host = urlsplit(url).hostname or ""
+        return any(host == domain or host.endswith("." + domain) for domain in self._blocked_domains)
+
+    async def _route_request(self, route):
+        """Abort requests for blocked resource types and domains"""
+        request = route.request
+        if request.resource_type in self._blocked_resources or (
+            self._blocked_domains and self._is_blocked_host(request.url)
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
     def _handle_console(self, msg):
         """Handle console messages from the browser"""
-        log_entry = f"[{msg.type.upper()}] {msg.text}"
-        self._console_logs.append(log_entry)
+        self._console_queue.put_nowait(f"[{msg.type.upper()}] {msg.text}")
 
     def _handle_page_error(self, error):
         """Handle page errors"""
-        log_entry = f"[PAGE_ERROR] {str(error)}"
-        self._console_logs.append(log_entry)
+        self._console_queue.put_nowait(f"[PAGE_ERROR] {str(error)}")
+
+    def _handle_frame_navigated(self, frame):
+        """Forget compiled scripts; they belong to the previous document"""
+        if frame == self.page.main_frame:
+            self._compiled.clear()
+
+    def _take_console_batch(self, batch: List[str], limit: int = 256) -> List[str]:
+        """Move queued console entries into batch without waiting"""
+        queue = self._console_queue
+        while len(batch) < limit and not queue.empty():
+            batch.append(queue.get_nowait())
+        return batch
+
+    def _deliver_console(self, batch: List[str]):
+        """Hand a batch of console entries to the sink or the local buffer"""
+        if self._console_sink:
+            # A failing sink loses this batch but must not stop the drain task
+            try:
+                self._console_sink(batch)
+            except Exception as e:
+                print(f"Console sink error: {e}")
+        else:
+            self._console_logs.extend(batch)
+
+    async def _drain_console(self):
+        """Deliver queued console entries in batches of up to 256"""
+        while True:
+            first = await self._console_queue.get()
+            self._deliver_console(self._take_console_batch([first]))
+
+    async def flush_console_logs(self):
+        """Deliver console entries still waiting in the queue"""
+        if not self._console_queue:
+            return
+        while not self._console_queue.empty():
+            self._deliver_console(self._take_console_batch([]))
 
-    async def navigate(self, url: str, wait_until: str = "networkidle") -> bool:
+    async def navigate(self, url: str, wait_until: str = "domcontentloaded",
+                       wait_for_selector: Optional[str] = None) -> bool:
         """
         Navigate to a URL
 
+        Pages with analytics or long-polling never reach networkidle, so the
+        default only waits for the DOM; pass wait_for_selector to also wait
+        for the element the caller actually needs.
+
         Args:
             url: Target URL
             wait_until: Wait condition (load, domcontentloaded, networkidle)
+            wait_for_selector: Optional CSS selector to wait for after loading
 
         Returns:
             True if navigation successful
@@ -115,8 +297,11 @@ class BrowserDriver:
         if not self.page:
             raise RuntimeError("Browser not initialized. Call init() first.")
 
+        self._last_shot_hash = None
         try:
-            await self.page.goto(url, wait_until=wait_until, timeout=30000)
+            await self.page.goto(url, wait_until=wait_until)
+            if wait_for_selector:
+                await self.page.wait_for_selector(wait_for_selector, state="visible")
             return True
         except Exception as e:
             print(f"Navigation error: {e}")
@@ -142,6 +327,113 @@ class BrowserDriver:
             print(f"JavaScript evaluation error: {e}")
             return None
 
+    async def compile_script(self, js_code: str) -> Optional[str]:
+        """
+        Compile JavaScript once so it can be run repeatedly by id
+
+        Uses the CDP Runtime domain, so it is only available on Chromium.
+        Ids are cached per source and dropped when the page navigates.
+
+        Args:
+            js_code: JavaScript code to compile
+
+        Returns:
+            Script id for run_compiled(), None if unsupported or on error
+        """
+        if not self.page:
+            raise RuntimeError("Browser not initialized. Call init() first.")
+
+        script_id = self._compiled.get(js_code)
+        if script_id:
+            return script_id
+        if self.browser_type != "chromium":
+            return None
+
+        try:
+            if not self._cdp:
+                self._cdp = await self.context.new_cdp_session(self.page)
+            result = await self._cdp.send("Runtime.compileScript", {
+                "expression": js_code,
+                "sourceURL": f"compiled_{len(self._compiled)}.js",
+                "persistScript": True
+            })
+            if "exceptionDetails" in result:
+                print(f"JavaScript compile error: {result['exceptionDetails'].get('text')}")
+                return None
+            script_id = self._compiled[js_code] = result["scriptId"]
+            return script_id
+        except Exception as e:
+            print(f"JavaScript compile error: {e}")
+            return None
+
+    async def run_compiled(self, script_id: str) -> Any:
+        """
+        Run a script compiled with compile_script()
+
+        Args:
+            script_id: Id returned by compile_script()
+
+        Returns:
+            Result of the JavaScript execution
+        """
+        if not self._cdp:
+            raise RuntimeError("No compiled scripts. Call compile_script() first.")
+
+        try:
+            result = await self._cdp.send("Runtime.runScript", {
+                "scriptId": script_id,
+                "returnByValue": True,
+                "awaitPromise": True
+            })
+            if "exceptionDetails" in result:
+                print(f"JavaScript evaluation error: {result['exceptionDetails'].get('text')}")
+                return None
+            return result["result"].get("value")
+        except Exception as e:
+            print(f"JavaScript evaluation error: {e}")
+            return None
+
+    async def query_many(self, queries: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Evaluate several JavaScript expressions in a single round-trip
+
+        Args:
+            queries: Mapping of result key to JavaScript expression
+
+        Returns:
+            Mapping of result key to expression value, None on error
+        """
+        js_code = "({" + ", ".join(
+            f"{json.dumps(key)}: ({expression})" for key, expression in queries.items()
+        ) + "})"
+        return await self.eval(js_code)
+
+    async def query_selectors(self, selectors: Dict[str, str]) -> Optional[Dict[str, bool]]:
+        """
+        Check which CSS selectors match an element, in a single round-trip
+
+        Args:
+            selectors: Mapping of result key to CSS selector
+
+        Returns:
+            Mapping of result key to whether the selector matched, None on error
+        """
+        return await self.query_many({
+            key: f"!!document.querySelector({json.dumps(selector)})"
+            for key, selector in selectors.items()
+        })
+
+    async def form_shape(self) -> Optional[Dict[str, Any]]:
+        """
+        Summarize the page's form fields in one pass over its controls
+
+        Returns:
+            Dict with hasForm, hasNameField, hasEmailField, hasMessageField,
+            hasSubmitButton, inputCount, textareaCount and buttonCount,
+            None on error
+        """
+        return await self.eval(_FORM_SHAPE_JS)
+
     async def click(self, selector: str, timeout: int = 10000) -> bool:
         """
         Click an element
@@ -185,6 +477,33 @@ class BrowserDriver:
             print(f"Fill error on '{selector}': {e}")
             return False
 
+    async def fill_many(self, fields: Dict[str, str]) -> bool:
+        """
+        Fill several input elements in a single round-trip
+
+        Values are set directly and input/change events dispatched, so
+        there is no per-field actionability wait as with fill().
+
+        Args:
+            fields: Mapping of CSS selector to text
+
+        Returns:
+            True if every field was found and filled
+        """
+        if not self.page:
+            raise RuntimeError("Browser not initialized. Call init() first.")
+
+        try:
+            missing = await self.page.evaluate(_FILL_MANY_JS, fields)
+        except Exception as e:
+            print(f"Fill error: {e}")
+            return False
+
+        if missing:
+            print(f"Fill error, no element for: {', '.join(missing)}")
+            return False
+        return True
+
     async def wait_for_selector(self, selector: str, timeout: int = 10000, state: str = "visible") -> bool:
         """
         Wait for an element to appear
@@ -207,40 +526,139 @@ class BrowserDriver:
             print(f"Wait for selector error '{selector}': {e}")
             return False
 
-    async def screenshot(self, filename: Optional[str] = None, full_page: bool = False) -> str:
+    async def wait_for_load_state(self, state: str = "networkidle", timeout: int = 5000) -> bool:
+        """
+        Wait for the page to reach a load state
+
+        Args:
+            state: Load state (load, domcontentloaded, networkidle)
+            timeout: Timeout in milliseconds
+
+        Returns:
+            True if the state was reached
+        """
+        if not self.page:
+            raise RuntimeError("Browser not initialized. Call init() first.")
+
+        try:
+            await self.page.wait_for_load_state(state, timeout=timeout)
+            return True
+        except Exception as e:
+            print(f"Wait for load state error '{state}': {e}")
+            return False
+
+    async def wait_for_condition(self, condition: str, timeout: float = 10) -> bool:
+        """
+        Wait for a JavaScript condition to become truthy
+
+        The browser re-checks the condition on every animation frame, so
+        this returns as soon as it flips instead of on a polling interval.
+
+        Args:
+            condition: JavaScript expression that evaluates to boolean
+            timeout: Maximum wait time in seconds
+
+        Returns:
+            True if condition met, False if timeout
+        """
+        if not self.page:
+            raise RuntimeError("Browser not initialized. Call init() first.")
+
+        try:
+            await self.page.wait_for_function(f"() => ({condition})", timeout=timeout * 1000)
+            return True
+        except Exception as e:
+            print(f"Wait for condition error '{condition}': {e}")
+            return False
+
+    async def screenshot(self, filename: Optional[str] = None, full_page: bool = False,
+                         return_bytes: bool = False, image_type: str = "png",
+                         quality: Optional[int] = None) -> Union[str, bytes]:
         """
         Take a screenshot
 
+        Args:
+            filename: Optional filename (auto-generated if not provided)
+            full_page: Capture full page instead of viewport
+            return_bytes: Return the encoded image instead of writing a file
+            image_type: Image format (png, jpeg)
+            quality: JPEG quality 0-100, ignored for PNG
+
+        Returns:
+            Path to the screenshot file, or the image bytes if return_bytes is set
+        """
+        if not self.page:
+            raise RuntimeError("Browser not initialized. Call init() first.")
+
+        options = {"full_page": full_page, "type": image_type}
+        if image_type == "jpeg" and quality is not None:
+            options["quality"] = quality
+
+        if return_bytes:
+            return await self.page.screenshot(**options)
+
+        filename = self._screenshot_path(filename, image_type)
+        await self.page.screenshot(path=filename, **options)
+        return filename
+
+    async def screenshot_if_changed(self, filename: Optional[str] = None,
+                                    full_page: bool = False) -> Optional[str]:
+        """
+        Take a screenshot, skipping the file write if nothing changed
+
+        The capture is hashed and compared with the previous call's; an
+        identical image is not written again. The hash is reset by navigate().
+
         Args:
             filename: Optional filename (auto-generated if not provided)
             full_page: Capture full page instead of viewport
 
         Returns:
-            Path to the screenshot file
+            Path to the screenshot file, or None if the page looks the same
         """
         if not self.page:
             raise RuntimeError("Browser not initialized. Call init() first.")
 
+        data = await self.page.screenshot(full_page=full_page, type="png")
+        digest = hashlib.sha256(data).hexdigest()
+        if digest == self._last_shot_hash:
+            return None
+        self._last_shot_hash = digest
+
+        filename = self._screenshot_path(filename, "png")
+        with open(filename, "wb") as f:
+            f.write(data)
+        return filename
+
+    def _screenshot_path(self, filename: Optional[str], image_type: str) -> str:
+        """Resolve a screenshot filename inside the screenshot directory"""
         if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
-            filename = f"{self._screenshot_dir}/screenshot_{timestamp}.png"
+            extension = "jpg" if image_type == "jpeg" else "png"
+            filename = f"{self._screenshot_dir}/screenshot_{self._session_prefix}_{self._shot_seq:06d}.{extension}"
+            self._shot_seq += 1
         elif not filename.startswith(self._screenshot_dir):
             filename = f"{self._screenshot_dir}/{filename}"
 
-        await self.page.screenshot(path=filename, full_page=full_page)
+        # Created on first write rather than at init
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
         return filename
 
     async def console_logs(self) -> List[str]:
         """
         Get collected console logs
 
+        Empty when a console_sink is set, since entries go straight to it.
+        At most max_logs entries are kept, newest last.
+
         Returns:
             List of console log entries
         """
-        return self._console_logs.copy()
+        await self.flush_console_logs()
+        return list(self._console_logs)
 
     async def clear_console_logs(self):
         """Clear collected console logs"""
+        await self.flush_console_logs()
         self._console_logs.clear()
 
     async def get_html(self) -> str:
@@ -279,7 +697,7 @@ class BrowserDriver:
 
         return self.page.url
 
-    async def reload(self, wait_until: str = "networkidle"):
+    async def reload(self, wait_until: str = "domcontentloaded"):
         """
         Reload the current page
 
@@ -311,16 +729,41 @@ class BrowserDriver:
             await self.page.close()
             self.page = None
 
+        if self._drain_task:
+            # Teardown must reach the context and browser whatever happens here
+            try:
+                await self.flush_console_logs()
+            except Exception as e:
+                print(f"Console flush error: {e}")
+            self._drain_task.cancel()
+            try:
+                await self._drain_task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                print(f"Console drain error: {e}")
+            self._drain_task = None
+
+        self._cdp = None
+        self._compiled.clear()
+
         if self.context:
             await self.context.close()
             self.context = None
 
+        if not self._owns_browser:
+            # Pooled driver: the browser stays up for the pool's other drivers
+            self.browser = None
+            self.initialized = False
+            return
+
         if self.browser:
             await self.browser.close()
             self.browser = None
 
         if self.playwright:
-            await self.playwright.stop()
+            if self._owns_playwright:
+                await self.playwright.stop()
             self.playwright = None
 
         self.initialized = False
@@ -337,3 +780,101 @@ class BrowserDriver:
     def __repr__(self) -> str:
         status = "initialized" if self.initialized else "not initialized"
         return f"<BrowserDriver browser={self.browser_type} status={status}>"
+
+
+class BrowserPool:
+    """
+    One Playwright instance and browser shared by many drivers
+
+    Each acquired driver gets its own context and page, which is far
+    cheaper than starting Playwright and a browser per driver. Prefer
+    this over separate BrowserDriver.init() calls when fanning out
+    across many pages.
+    """
+
+    def __init__(self, browser_type: str = "chromium"):
+        """
+        Initialize browser pool
+
+        Args:
+            browser_type: Browser type (chromium, firefox, webkit)
+        """
+        if not PLAYWRIGHT_AVAILABLE:
+            raise ImportError(
+                "Playwright not installed. Install with: pip install playwright && playwright install"
+            )
+
+        self.browser_type = browser_type
+        self.playwright = None
+        self.browser: Optional[Browser] = None
+        self._owns_playwright = True
+
+    async def start(self, headless: bool = True, playwright=None,
+                    cdp_endpoint: Optional[str] = None):
+        """
+        Start Playwright and launch the shared browser
+
+        Args:
+            headless: Run browser in headless mode
+            playwright: Already started Playwright instance to reuse instead of
+                starting another driver process; left running by close()
+            cdp_endpoint: URL of a running Chromium (e.g. browser_server.py) to
+                connect to instead of launching one; falls back to a launch
+        """
+        if self.browser:
+            return
+
+        self._owns_playwright = playwright is None
+        self.playwright = playwright or await async_playwright().start()
+        self.browser = await _start_browser(self.playwright, self.browser_type, headless, cdp_endpoint)
+
+    async def acquire(self, viewport: Optional[Dict[str, int]] = None,
+                      block_resources: Optional[Iterable[str]] = None,
+                      block_domains: Optional[Iterable[str]] = None,
+                      console_sink: Optional[Callable[[List[str]], None]] = None) -> BrowserDriver:
+        """
+        Get a ready driver backed by a fresh context on the shared browser
+
+        Closing the driver only closes its context.
+
+        Args:
+            viewport: Viewport size dict with 'width' and 'height'
+            block_resources: Resource types to abort; everything loads when None
+            block_domains: Hosts whose requests are aborted, subdomains included
+            console_sink: Optional callback receiving console entries in batches
+
+        Returns:
+            Initialized BrowserDriver
+        """
+        if not self.browser:
+            raise RuntimeError("Browser pool not started. Call start() first.")
+
+        driver = BrowserDriver(self.browser_type, console_sink=console_sink)
+        driver._owns_browser = False
+        driver.browser = self.browser
+        await driver._open_context(viewport, block_resources, block_domains)
+        return driver
+
+    async def close(self):
+        """Close the shared browser and stop Playwright if the pool started it"""
+        if self.browser:
+            await self.browser.close()
+            self.browser = None
+
+        if self.playwright:
+            if self._owns_playwright:
+                await self.playwright.stop()
+            self.playwright = None
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+
+    def __repr__(self) -> str:
+        status = "started" if self.browser else "not started"
+        return f"<BrowserPool browser={self.browser_type} status={status}>"
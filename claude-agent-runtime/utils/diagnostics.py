@@ -3,10 +3,20 @@ Console Diagnostics and Performance Monitoring
 Tools for analyzing browser console output and performance metrics
 """
 
+import asyncio
+import math
 import re
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import List, Dict, Any, Optional, Deque, Iterable, Tuple
 from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, deque
+
+# Report separators
+_SEP_EQ = "=" * 60
+_SEP_DASH = "-" * 60
+
+# Test status markers used by TestReporter
+_STATUS_ICON = {"passed": "✓", "failed": "✗", "skipped": "-"}
 
 
 class ConsoleDiagnostics:
@@ -14,15 +24,36 @@ class ConsoleDiagnostics:
     Analyze and categorize browser console logs
     """
 
-    def __init__(self):
-        self.logs: List[str] = []
-        self.categories = {
-            "errors": [],
-            "warnings": [],
-            "info": [],
-            "debug": [],
-            "network": [],
-            "other": []
+    __slots__ = ("logs", "categories")
+
+    # BrowserDriver emits "[TAG] text" with an upper-case tag; an error tag
+    # is already the top rank, so those skip the scan of the message
+    _ERROR_PREFIXES = ("[ERROR]", "[PAGE_ERROR]")
+    # Otherwise the highest-ranked [TAG] anywhere in a log decides its category
+    _TAG_RE = re.compile(r"\[(error|page_error|warning|warn|info|log|debug)\]", re.IGNORECASE)
+    _TAG_TO_CAT = {
+        "error": "errors",
+        "page_error": "errors",
+        "warning": "warnings",
+        "warn": "warnings",
+        "info": "info",
+        "log": "info",
+        "debug": "debug"
+    }
+    _CAT_RANK = {"errors": 0, "warnings": 1, "info": 2, "debug": 3}
+    _NETWORK_RE = re.compile(r"network|fetch|xhr", re.IGNORECASE)
+
+    def __init__(self, max_logs: int = 10000):
+        """
+        Initialize console diagnostics
+
+        Args:
+            max_logs: Entries kept overall and per category; the oldest are dropped first
+        """
+        self.logs: Deque[str] = deque(maxlen=max_logs)
+        self.categories: Dict[str, Deque[str]] = {
+            category: deque(maxlen=max_logs)
+            for category in ("errors", "warnings", "info", "debug", "network", "other")
         }
 
     def add_log(self, log: str):
@@ -32,37 +63,50 @@ class ConsoleDiagnostics:
 
     def add_logs(self, logs: List[str]):
         """Add multiple log entries"""
+        self.logs.extend(logs)
+        categorize = self._categorize_log
         for log in logs:
-            self.add_log(log)
+            categorize(log)
 
     def _categorize_log(self, log: str):
-        """Categorize a log entry"""
-        log_lower = log.lower()
+        """
+        Categorize a log entry
+
+        A log carrying several tags goes to the highest-ranked one
+        (errors > warnings > info > debug):
 
-        if "[error]" in log_lower or "[page_error]" in log_lower:
+        >>> diagnostics = ConsoleDiagnostics()
+        >>> diagnostics.add_log("submit [LOG] then [ERROR] failed")
+        >>> diagnostics.add_log("[LOG] [ERROR] submit failed")
+        >>> diagnostics.get_errors()
+        ['submit [LOG] then [ERROR] failed', '[LOG] [ERROR] submit failed']
+        """
+        if log.startswith(self._ERROR_PREFIXES):
             self.categories["errors"].append(log)
-        elif "[warning]" in log_lower or "[warn]" in log_lower:
-            self.categories["warnings"].append(log)
-        elif "[info]" in log_lower or "[log]" in log_lower:
-            self.categories["info"].append(log)
-        elif "[debug]" in log_lower:
-            self.categories["debug"].append(log)
-        elif "network" in log_lower or "fetch" in log_lower or "xhr" in log_lower:
+            return
+
+        tags = self._TAG_RE.findall(log)
+
+        if tags:
+            tag_to_cat = self._TAG_TO_CAT
+            category = min((tag_to_cat[tag.lower()] for tag in tags), key=self._CAT_RANK.__getitem__)
+            self.categories[category].append(log)
+        elif self._NETWORK_RE.search(log, 0, 200):
             self.categories["network"].append(log)
         else:
             self.categories["other"].append(log)
 
     def get_errors(self) -> List[str]:
         """Get all error logs"""
-        return self.categories["errors"]
+        return list(self.categories["errors"])
 
     def get_warnings(self) -> List[str]:
         """Get all warning logs"""
-        return self.categories["warnings"]
+        return list(self.categories["warnings"])
 
     def get_network_logs(self) -> List[str]:
         """Get all network-related logs"""
-        return self.categories["network"]
+        return list(self.categories["network"])
 
     def has_errors(self) -> bool:
         """Check if there are any errors"""
@@ -97,48 +141,54 @@ class ConsoleDiagnostics:
 
     def filter_by_category(self, category: str) -> List[str]:
         """Get logs from a specific category"""
-        return self.categories.get(category, [])
+        return list(self.categories.get(category, ()))
 
     def generate_report(self) -> str:
         """Generate a formatted diagnostic report"""
         report_lines = [
-            "=" * 60,
+            _SEP_EQ,
             "Console Diagnostics Report",
-            "=" * 60,
+            _SEP_EQ,
             f"Total Logs: {len(self.logs)}",
             f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
             "",
             "Summary by Category:",
-            "-" * 60
+            _SEP_DASH
         ]
 
-        summary = self.get_summary()
-        for category, count in summary.items():
-            report_lines.append(f"  {category.capitalize()}: {count}")
+        report_lines.extend(
+            f"  {category.capitalize()}: {count}" for category, count in self.get_summary().items()
+        )
 
-        if self.has_errors():
+        errors = self.categories["errors"]
+        error_count = len(errors)
+        if error_count:
             report_lines.extend([
                 "",
                 "Errors:",
-                "-" * 60
+                _SEP_DASH
             ])
-            for i, error in enumerate(self.get_errors()[:10], 1):
-                report_lines.append(f"  {i}. {error[:100]}")
-            if len(self.get_errors()) > 10:
-                report_lines.append(f"  ... and {len(self.get_errors()) - 10} more")
-
-        if self.has_warnings():
+            report_lines.extend(
+                f"  {i}. {error[:100]}" for i, error in enumerate(islice(errors, 10), 1)
+            )
+            if error_count > 10:
+                report_lines.append(f"  ... and {error_count - 10} more")
+
+        warnings = self.categories["warnings"]
+        warning_count = len(warnings)
+        if warning_count:
             report_lines.extend([
                 "",
                 "Warnings:",
-                "-" * 60
+                _SEP_DASH
             ])
-            for i, warning in enumerate(self.get_warnings()[:5], 1):
-                report_lines.append(f"  {i}. {warning[:100]}")
-            if len(self.get_warnings()) > 5:
-                report_lines.append(f"  ... and {len(self.get_warnings()) - 5} more")
+            report_lines.extend(
+                f"  {i}. {warning[:100]}" for i, warning in enumerate(islice(warnings, 5), 1)
+            )
+            if warning_count > 5:
+                report_lines.append(f"  ... and {warning_count - 5} more")
 
-        report_lines.append("=" * 60)
+        report_lines.append(_SEP_EQ)
         return "\n".join(report_lines)
 
     def clear(self):
@@ -148,14 +198,33 @@ class ConsoleDiagnostics:
             category.clear()
 
 
+def _new_aggregate() -> Dict[str, float]:
+    """Running statistics for one metric"""
+    return {"n": 0, "sum": 0.0, "min": math.inf, "max": -math.inf, "last": 0.0}
+
+
 class PerformanceMonitor:
     """
     Monitor and analyze browser performance metrics
     """
 
-    def __init__(self):
+    __slots__ = ("keep_history", "track_timestamps", "metrics", "timestamps", "_agg")
+
+    def __init__(self, keep_history: bool = True, track_timestamps: bool = False):
+        """
+        Initialize performance monitor
+
+        Args:
+            keep_history: Keep every recorded value; summaries come from
+                running aggregates either way
+            track_timestamps: Also keep a timestamp per recorded value
+                (only with keep_history)
+        """
+        self.keep_history = keep_history
+        self.track_timestamps = track_timestamps
         self.metrics: Dict[str, List[float]] = defaultdict(list)
         self.timestamps: Dict[str, List[str]] = defaultdict(list)
+        self._agg: Dict[str, Dict[str, float]] = defaultdict(_new_aggregate)
 
     def record_metric(self, name: str, value: float):
         """
@@ -165,55 +234,85 @@ class PerformanceMonitor:
             name: Metric name
             value: Metric value
         """
-        self.metrics[name].append(value)
-        self.timestamps[name].append(datetime.now().isoformat())
+        timestamp = datetime.now().isoformat() if self.keep_history and self.track_timestamps else None
+        self._record(name, value, timestamp)
+
+    def record_metrics(self, pairs: Iterable[Tuple[str, float]], timestamp: Optional[str] = None):
+        """
+        Record a batch of performance metrics sharing one timestamp
+
+        Args:
+            pairs: (name, value) pairs
+            timestamp: ISO timestamp for the batch (now if not provided)
+        """
+        if self.keep_history and self.track_timestamps:
+            timestamp = timestamp or datetime.now().isoformat()
+        else:
+            timestamp = None
+
+        record = self._record
+        for name, value in pairs:
+            record(name, value, timestamp)
+
+    def _record(self, name: str, value: float, timestamp: Optional[str]):
+        """Fold one value into the aggregates and, if kept, the history"""
+        agg = self._agg[name]
+        agg["n"] += 1
+        agg["sum"] += value
+        if value < agg["min"]:
+            agg["min"] = value
+        if value > agg["max"]:
+            agg["max"] = value
+        agg["last"] = value
+
+        if self.keep_history:
+            self.metrics[name].append(value)
+            if timestamp is not None:
+                self.timestamps[name].append(timestamp)
 
     def get_metric(self, name: str) -> List[float]:
-        """Get all values for a metric"""
+        """Get all values for a metric (empty unless keep_history is set)"""
         return self.metrics.get(name, [])
 
     def get_average(self, name: str) -> Optional[float]:
         """Get average value for a metric"""
-        values = self.get_metric(name)
-        return sum(values) / len(values) if values else None
+        agg = self._agg.get(name)
+        return agg["sum"] / agg["n"] if agg else None
 
     def get_min(self, name: str) -> Optional[float]:
         """Get minimum value for a metric"""
-        values = self.get_metric(name)
-        return min(values) if values else None
+        agg = self._agg.get(name)
+        return agg["min"] if agg else None
 
     def get_max(self, name: str) -> Optional[float]:
         """Get maximum value for a metric"""
-        values = self.get_metric(name)
-        return max(values) if values else None
+        agg = self._agg.get(name)
+        return agg["max"] if agg else None
 
     def get_latest(self, name: str) -> Optional[float]:
         """Get latest value for a metric"""
-        values = self.get_metric(name)
-        return values[-1] if values else None
+        agg = self._agg.get(name)
+        return agg["last"] if agg else None
 
     def get_summary(self) -> Dict[str, Dict[str, Any]]:
         """Get summary statistics for all metrics"""
-        summary = {}
-
-        for name, values in self.metrics.items():
-            if values:
-                summary[name] = {
-                    "count": len(values),
-                    "average": sum(values) / len(values),
-                    "min": min(values),
-                    "max": max(values),
-                    "latest": values[-1]
-                }
-
-        return summary
+        return {
+            name: {
+                "count": agg["n"],
+                "average": agg["sum"] / agg["n"],
+                "min": agg["min"],
+                "max": agg["max"],
+                "latest": agg["last"]
+            }
+            for name, agg in self._agg.items()
+        }
 
     def generate_report(self) -> str:
         """Generate a formatted performance report"""
         report_lines = [
-            "=" * 60,
+            _SEP_EQ,
             "Performance Monitoring Report",
-            "=" * 60,
+            _SEP_EQ,
             f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
             ""
         ]
@@ -224,7 +323,7 @@ class PerformanceMonitor:
             report_lines.append("No performance metrics recorded.")
         else:
             report_lines.append("Metrics Summary:")
-            report_lines.append("-" * 60)
+            report_lines.append(_SEP_DASH)
 
             for name, stats in summary.items():
                 report_lines.extend([
@@ -236,7 +335,7 @@ class PerformanceMonitor:
                     f"  Latest: {stats['latest']:.2f}"
                 ])
 
-        report_lines.append("\n" + "=" * 60)
+        report_lines.append("\n" + _SEP_EQ)
         return "\n".join(report_lines)
 
     def clear(self, metric_name: Optional[str] = None):
@@ -247,10 +346,12 @@ class PerformanceMonitor:
             metric_name: Specific metric to clear, or None to clear all
         """
         if metric_name:
+            self._agg.pop(metric_name, None)
             if metric_name in self.metrics:
                 self.metrics[metric_name].clear()
                 self.timestamps[metric_name].clear()
         else:
+            self._agg.clear()
             self.metrics.clear()
             self.timestamps.clear()
 
@@ -260,9 +361,15 @@ class TestReporter:
     Generate test reports from browser automation sessions
     """
 
+    __slots__ = ("test_results", "session_start", "_counts", "_total", "_total_duration")
+
     def __init__(self):
         self.test_results: List[Dict[str, Any]] = []
         self.session_start = datetime.now()
+        # Running totals so get_summary never rescans the results
+        self._counts: Dict[str, int] = {"passed": 0, "failed": 0, "skipped": 0}
+        self._total = 0
+        self._total_duration = 0.0
 
     def add_test_result(self,
                        test_name: str,
@@ -276,32 +383,30 @@ class TestReporter:
             test_name: Name of the test
             status: Test status (passed, failed, skipped)
             duration: Test duration in seconds
-            details: Optional additional details
+            details: Optional additional details, stored only when given
         """
         result = {
             "name": test_name,
             "status": status,
             "duration": duration,
-            "timestamp": datetime.now().isoformat(),
-            "details": details or {}
+            "timestamp": datetime.now().isoformat()
         }
+        if details:
+            result["details"] = details
         self.test_results.append(result)
 
+        self._counts[status] = self._counts.get(status, 0) + 1
+        self._total += 1
+        self._total_duration += duration
+
     def get_summary(self) -> Dict[str, Any]:
         """Get test execution summary"""
-        total = len(self.test_results)
-        passed = sum(1 for r in self.test_results if r["status"] == "passed")
-        failed = sum(1 for r in self.test_results if r["status"] == "failed")
-        skipped = sum(1 for r in self.test_results if r["status"] == "skipped")
-
-        total_duration = sum(r["duration"] for r in self.test_results)
-
         return {
-            "total": total,
-            "passed": passed,
-            "failed": failed,
-            "skipped": skipped,
-            "duration": total_duration,
+            "total": self._total,
+            "passed": self._counts["passed"],
+            "failed": self._counts["failed"],
+            "skipped": self._counts["skipped"],
+            "duration": self._total_duration,
             "session_duration": (datetime.now() - self.session_start).total_seconds()
         }
 
@@ -310,42 +415,55 @@ class TestReporter:
         summary = self.get_summary()
 
         report_lines = [
-            "=" * 60,
+            _SEP_EQ,
             "Test Execution Report",
-            "=" * 60,
+            _SEP_EQ,
             f"Session Start: {self.session_start.strftime('%Y-%m-%d %H:%M:%S')}",
             f"Total Duration: {summary['session_duration']:.2f}s",
             "",
             "Summary:",
-            "-" * 60,
+            _SEP_DASH,
             f"  Total Tests: {summary['total']}",
-            f"  Passed: {summary['passed']} ✓",
-            f"  Failed: {summary['failed']} ✗",
-            f"  Skipped: {summary['skipped']} -",
+            f"  Passed: {summary['passed']} {_STATUS_ICON['passed']}",
+            f"  Failed: {summary['failed']} {_STATUS_ICON['failed']}",
+            f"  Skipped: {summary['skipped']} {_STATUS_ICON['skipped']}",
             f"  Test Duration: {summary['duration']:.2f}s",
             ""
         ]
 
         if self.test_results:
             report_lines.append("Test Results:")
-            report_lines.append("-" * 60)
+            report_lines.append(_SEP_DASH)
 
-            for result in self.test_results:
-                status_icon = "✓" if result["status"] == "passed" else "✗" if result["status"] == "failed" else "-"
-                report_lines.append(
-                    f"  {status_icon} {result['name']} ({result['duration']:.2f}s)"
-                )
+            icon_for = _STATUS_ICON.get
+            report_lines.extend([
+                f"  {icon_for(result['status'], '-')} {result['name']} ({result['duration']:.2f}s)"
+                for result in self.test_results
+            ])
 
-        report_lines.append("=" * 60)
+        report_lines.append(_SEP_EQ)
         return "\n".join(report_lines)
 
+    @staticmethod
+    def _write_report(filename: str, report: str):
+        """Write a rendered report in one buffered write"""
+        with open(filename, 'w', encoding='utf-8', buffering=1024 * 1024) as f:
+            f.write(report)
+
     def save_report(self, filename: str):
         """Save report to file"""
+        self._write_report(filename, self.generate_report())
+
+    async def save_report_async(self, filename: str):
+        """Save report to file without blocking the event loop"""
+        # Render here so the results can't change while the thread writes
         report = self.generate_report()
-        with open(filename, 'w') as f:
-            f.write(report)
+        await asyncio.to_thread(self._write_report, filename, report)
 
     def clear(self):
         """Clear all test results"""
         self.test_results.clear()
         self.session_start = datetime.now()
+        self._counts = {"passed": 0, "failed": 0, "skipped": 0}
+        self._total = 0
+        self._total_duration = 0.0
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Browser Test Runner
+Runs the local browser tests concurrently on one shared browser
+"""
+
+import sys
+import os
+import asyncio
+import importlib.util
+
+# Set UTF-8 encoding for Windows console
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.stderr.reconfigure(encoding='utf-8')
+
+from test_helpers import BrowserPool, start_pool
+
+# (script, test coroutine) pairs; each test takes the shared pool
+TEST_SCRIPTS = [
+    ('test-contact-submission.py', 'test_contact_form_submission'),
+    ('test-emojifusion-local.py', 'test_emojifusion'),
+    ('test-landing-local.py', 'test_landing_page'),
+]
+
+def load_test(filename, function_name):
+    """Import a test script by path (the names aren't valid modules) and return its test"""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+    spec = importlib.util.spec_from_file_location(filename[:-3].replace('-', '_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, function_name)
+
+async def run_all_tests():
+    """Run every browser test in its own context on a single browser"""
+
+    print("🧪 Running all browser tests on one shared browser...")
+    print("=" * 60)
+
+    tests = [load_test(filename, function_name) for filename, function_name in TEST_SCRIPTS]
+
+    pool = BrowserPool()
+    try:
+        await start_pool(pool)
+        print("✅ Browser initialized")
+
+        # Each test reports and handles its own failures
+        await asyncio.gather(*(test(pool) for test in tests))
+
+    finally:
+        print("\n🧹 Closing shared browser...")
+        await pool.close()
+        print("✅ All tests complete")
+
+if __name__ == "__main__":
+    asyncio.run(run_all_tests())
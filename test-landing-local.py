@@ -6,7 +6,6 @@ Tests the landing page running on localhost using Claude Agent Runtime
 """
 
 import sys
-import os
 import asyncio
 
 # Set UTF-8 encoding for Windows console
@@ -14,158 +13,152 @@ if sys.platform == "win32":
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
-# Add claude-agent-runtime to path
-sys.path.append(os.path.join(os.path.dirname(__file__), 'claude-agent-runtime'))
+from test_helpers import ConsoleDiagnostics, BufferedLog, open_driver, inspect_pause
 
-from drivers.playwright_driver import BrowserDriver
-from utils.diagnostics import ConsoleDiagnostics
+async def test_landing_page(pool=None):
+    """
+    Test AyoType landing page on localhost
 
-async def test_landing_page():
-    """Test AyoType landing page on localhost"""
+    Runs in a fresh context on pool's browser when one is given,
+    otherwise starts and stops its own browser.
+    """
 
-    print("🏠 Starting Landing Page Browser Test...")
-    print("=" * 60)
+    log = BufferedLog()
+    log("🏠 Starting Landing Page Browser Test...")
+    log("=" * 60)
 
-    # Initialize browser driver
-    driver = BrowserDriver()
     diagnostics = ConsoleDiagnostics()
 
     try:
-        # Initialize browser (visible, not headless)
-        await driver.init(headless=False, viewport={"width": 1280, "height": 720})
-        print("✅ Browser initialized")
-
-        # Navigate to Landing Page
-        url = "http://127.0.0.1:3000/apps/landing/index.html"
-        print(f"\n📍 Navigating to {url}")
-        await driver.navigate(url)
-        await asyncio.sleep(2)  # Wait for page to load
-
-        # Take initial screenshot
-        screenshot1 = await driver.screenshot()
-        print(f"📸 Initial screenshot: {screenshot1}")
-
-        # Get page title
-        title = await driver.get_title()
-        print(f"📄 Page title: {title}")
-
-        # Check page structure
-        print("\n🔍 Checking page structure...")
-
-        # Check for main elements
-        page_analysis = await driver.eval("""
-            ({
-                hasHeader: !!document.querySelector('header'),
-                hasNav: !!document.querySelector('nav'),
-                hasMain: !!document.querySelector('main'),
-                hasFooter: !!document.querySelector('footer'),
-                linkCount: document.querySelectorAll('a').length,
-                headingCount: document.querySelectorAll('h1, h2, h3').length,
-                imageCount: document.querySelectorAll('img').length,
-                projectCards: document.querySelectorAll('.project-card, .card, [class*="project"]').length
-            })
-        """)
-
-        print(f"  • Header: {'✅' if page_analysis['hasHeader'] else '❌'}")
-        print(f"  • Navigation: {'✅' if page_analysis['hasNav'] else '❌'}")
-        print(f"  • Main content: {'✅' if page_analysis['hasMain'] else '❌'}")
-        print(f"  • Footer: {'✅' if page_analysis['hasFooter'] else '❌'}")
-        print(f"  • Links found: {page_analysis['linkCount']}")
-        print(f"  • Headings found: {page_analysis['headingCount']}")
-        print(f"  • Images found: {page_analysis['imageCount']}")
-        print(f"  • Project cards: {page_analysis['projectCards']}")
-
-        # Check for EmojiFusion link
-        print("\n🔍 Looking for EmojiFusion link...")
-        emojifusion_link = await driver.eval("""
-            Array.from(document.querySelectorAll('a')).find(a =>
-                a.textContent.toLowerCase().includes('emojifusion') ||
-                a.href.includes('emojifusion')
-            )?.href || null
-        """)
-
-        if emojifusion_link:
-            print(f"✅ Found EmojiFusion link: {emojifusion_link}")
-        else:
-            print("⚠️  EmojiFusion link not found")
-
-        # Check for contact link
-        print("\n🔍 Looking for Contact link...")
-        contact_link = await driver.eval("""
-            Array.from(document.querySelectorAll('a')).find(a =>
-                a.textContent.toLowerCase().includes('contact') ||
-                a.href.includes('contact')
-            )?.href || null
-        """)
-
-        if contact_link:
-            print(f"✅ Found Contact link: {contact_link}")
-        else:
-            print("⚠️  Contact link not found")
-
-        # Scroll down to check if lazy-loaded content appears
-        print("\n📜 Scrolling page...")
-        await driver.eval("window.scrollTo(0, document.body.scrollHeight)")
-        await asyncio.sleep(1)
-
-        # Take screenshot after scroll
-        screenshot2 = await driver.screenshot()
-        print(f"📸 Scroll screenshot: {screenshot2}")
-
-        # Get console logs
-        print("\n📋 Checking console logs...")
-        logs = await driver.console_logs()
-        diagnostics.add_logs(logs)
-
-        # Check for errors
-        if diagnostics.has_errors():
-            print("\n❌ ERRORS FOUND IN CONSOLE:")
-            for error in diagnostics.get_errors():
-                print(f"  • {error}")
-        else:
-            print("✅ No console errors detected")
-
-        # Show warnings if any
-        warnings = diagnostics.get_warnings()
-        if warnings:
-            print(f"\n⚠️  {len(warnings)} warnings found:")
-            for warning in warnings[:5]:  # Show first 5
-                print(f"  • {warning}")
-
-        # Generate diagnostics report
-        print("\n" + "=" * 60)
-        print("📊 DIAGNOSTICS REPORT")
-        print("=" * 60)
-        print(diagnostics.generate_report())
-
-        # Final verdict
-        print("\n" + "=" * 60)
-        # Updated criteria: page doesn't need semantic HTML5 tags
-        has_basic_structure = (page_analysis['linkCount'] > 0 and
-                              page_analysis['headingCount'] > 0)
-
-        if not diagnostics.has_errors() and has_basic_structure:
-            print("✅ TEST PASSED: Landing page is working correctly!")
-        elif has_basic_structure:
-            print("⚠️  TEST PARTIAL: Page loads but has console errors")
-        else:
-            print("❌ TEST FAILED: Page structure incomplete")
-        print("=" * 60)
-
-        # Keep browser open for manual inspection
-        print("\n👀 Browser will stay open for 15 seconds for manual inspection...")
-        await asyncio.sleep(15)
+        async with open_driver(log, pool, viewport={"width": 1280, "height": 720},
+                               console_sink=diagnostics.add_logs) as driver:
+            # Navigate to Landing Page
+            url = "http://127.0.0.1:3000/apps/landing/index.html"
+            log(f"\n📍 Navigating to {url}")
+            await driver.navigate(url)
+            await driver.wait_for_load_state("networkidle", timeout=5000)
+
+            # Take initial screenshot
+            screenshot1 = await driver.screenshot_if_changed()
+            log(f"📸 Initial screenshot: {screenshot1 or 'unchanged, not saved'}")
+
+            # Get page title
+            title = await driver.get_title()
+            log(f"📄 Page title: {title}")
+
+            # Check page structure
+            log("\n🔍 Checking page structure...")
+
+            # Check for main elements and the app links in one round-trip,
+            # collecting the anchors once for the count and both link lookups
+            page_analysis = await driver.eval("""
+                (() => {
+                    const anchors = Array.from(document.querySelectorAll('a'));
+                    const findLink = (word) => anchors.find(a =>
+                        a.textContent.toLowerCase().includes(word) ||
+                        a.href.includes(word)
+                    )?.href || null;
+                    return {
+                        hasHeader: !!document.querySelector('header'),
+                        hasNav: !!document.querySelector('nav'),
+                        hasMain: !!document.querySelector('main'),
+                        hasFooter: !!document.querySelector('footer'),
+                        linkCount: anchors.length,
+                        headingCount: document.querySelectorAll('h1, h2, h3').length,
+                        imageCount: document.querySelectorAll('img').length,
+                        projectCards: document.querySelectorAll('.project-card, .card, [class*="project"]').length,
+                        emojifusionLink: findLink('emojifusion'),
+                        contactLink: findLink('contact')
+                    };
+                })()
+            """)
+
+            log(f"  • Header: {'✅' if page_analysis['hasHeader'] else '❌'}")
+            log(f"  • Navigation: {'✅' if page_analysis['hasNav'] else '❌'}")
+            log(f"  • Main content: {'✅' if page_analysis['hasMain'] else '❌'}")
+            log(f"  • Footer: {'✅' if page_analysis['hasFooter'] else '❌'}")
+            log(f"  • Links found: {page_analysis['linkCount']}")
+            log(f"  • Headings found: {page_analysis['headingCount']}")
+            log(f"  • Images found: {page_analysis['imageCount']}")
+            log(f"  • Project cards: {page_analysis['projectCards']}")
+
+            # Check for EmojiFusion link
+            log("\n🔍 Looking for EmojiFusion link...")
+            emojifusion_link = page_analysis['emojifusionLink']
+
+            if emojifusion_link:
+                log(f"✅ Found EmojiFusion link: {emojifusion_link}")
+            else:
+                log("⚠️  EmojiFusion link not found")
+
+            # Check for contact link
+            log("\n🔍 Looking for Contact link...")
+            contact_link = page_analysis['contactLink']
+
+            if contact_link:
+                log(f"✅ Found Contact link: {contact_link}")
+            else:
+                log("⚠️  Contact link not found")
+
+            # Scroll down to check if lazy-loaded content appears
+            log("\n📜 Scrolling page...")
+            await driver.eval("window.scrollTo(0, document.body.scrollHeight)")
+            # Wait for images revealed by the scroll to finish loading, capped
+            # at the 1s the old fixed sleep took
+            await driver.wait_for_condition(
+                "Array.from(document.images).every(img => img.complete)", timeout=1)
+
+            # Take screenshot after scroll
+            screenshot2 = await driver.screenshot_if_changed()
+            log(f"📸 Scroll screenshot: {screenshot2 or 'unchanged, not saved'}")
+
+            # Console logs were collected by diagnostics as they arrived
+            log("\n📋 Checking console logs...")
+            await driver.flush_console_logs()
+
+            # Check for errors
+            if diagnostics.has_errors():
+                log("\n❌ ERRORS FOUND IN CONSOLE:")
+                for error in diagnostics.get_errors():
+                    log(f"  • {error}")
+            else:
+                log("✅ No console errors detected")
+
+            # Show warnings if any
+            warnings = diagnostics.get_warnings()
+            if warnings:
+                log(f"\n⚠️  {len(warnings)} warnings found:")
+                for warning in warnings[:5]:  # Show first 5
+                    log(f"  • {warning}")
+
+            # Generate diagnostics report
+            log("\n" + "=" * 60)
+            log("📊 DIAGNOSTICS REPORT")
+            log("=" * 60)
+            log(diagnostics.generate_report())
+
+            # Final verdict
+            log("\n" + "=" * 60)
+            # Updated criteria: page doesn't need semantic HTML5 tags
+            has_basic_structure = (page_analysis['linkCount'] > 0 and
+                                  page_analysis['headingCount'] > 0)
+
+            if not diagnostics.has_errors() and has_basic_structure:
+                log("✅ TEST PASSED: Landing page is working correctly!")
+            elif has_basic_structure:
+                log("⚠️  TEST PARTIAL: Page loads but has console errors")
+            else:
+                log("❌ TEST FAILED: Page structure incomplete")
+            log("=" * 60)
+
+            await inspect_pause(log)
 
     except Exception as e:
-        print(f"\n❌ TEST ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception(e)
 
     finally:
-        # Clean up
-        print("\n🧹 Closing browser...")
-        await driver.close()
-        print("✅ Test complete")
+        log("✅ Test complete")
+        log.flush()
 
 if __name__ == "__main__":
     asyncio.run(test_landing_page())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared setup for the local browser test scripts
+Puts claude-agent-runtime on the path once, re-exports what the tests use
+and holds the scaffolding every test repeats: buffered output, getting a
+driver from a shared or private browser, and the inspection pause
+"""
+
+import sys
+import os
+import asyncio
+import traceback
+from contextlib import asynccontextmanager
+
+# Add claude-agent-runtime to path (once, however many scripts import this)
+RUNTIME_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'claude-agent-runtime')
+if RUNTIME_DIR not in sys.path:
+    sys.path.append(RUNTIME_DIR)
+
+from drivers.playwright_driver import BrowserPool
+from utils.diagnostics import ConsoleDiagnostics
+
+__all__ = ["BrowserPool", "ConsoleDiagnostics", "BufferedLog", "start_pool",
+           "open_driver", "inspect_pause"]
+
+class BufferedLog:
+    """
+    Output lines for one test, written in one go by flush()
+
+    Tests run side by side (run_all_tests.py) don't interleave their lines.
+    """
+
+    def __init__(self):
+        self._lines = []
+
+    def __call__(self, line):
+        self._lines.append(line)
+
+    def exception(self, error):
+        """Log a test error with its traceback"""
+        self._lines.append(f"\n❌ TEST ERROR: {error}")
+        self._lines.append(traceback.format_exc().rstrip())
+
+    def flush(self):
+        """Write the buffered lines to stdout"""
+        if not self._lines:
+            return
+        sys.stdout.write("\n".join(self._lines) + "\n")
+        sys.stdout.flush()
+        self._lines.clear()
+
+async def start_pool(pool):
+    """Start pool's browser, or join a warm one; only visible when it will be inspected"""
+    await pool.start(headless=not os.environ.get("INSPECT_SECONDS"),
+                     cdp_endpoint=os.environ.get("BROWSER_CDP_URL"))
+
+@asynccontextmanager
+async def open_driver(log, pool=None, viewport=None, console_sink=None):
+    """
+    Yield a driver on a fresh context of pool's browser
+
+    Without a pool a browser is started here and closed again on exit;
+    a shared browser is left to (and reported by) its owner.
+    """
+    own_pool = pool is None
+    if own_pool:
+        pool = BrowserPool()
+    driver = None
+    try:
+        if own_pool:
+            await start_pool(pool)
+            log("✅ Browser initialized")
+        driver = await pool.acquire(viewport=viewport, console_sink=console_sink)
+        yield driver
+    finally:
+        if driver:
+            await driver.close()
+        if own_pool:
+            log("\n🧹 Closing browser...")
+            await pool.close()
+
+async def inspect_pause(log):
+    """Keep the browser open for manual inspection when INSPECT_SECONDS is set"""
+    inspect_seconds = int(os.environ.get("INSPECT_SECONDS") or 0)
+    if inspect_seconds:
+        log(f"\n👀 Browser will stay open for {inspect_seconds} seconds for manual inspection...")
+        log.flush()
+        await asyncio.sleep(inspect_seconds)